@@ -16,6 +16,12 @@ from collections import Counter
 
 from .vectorizer import SimpleVectorizer
 
+np: Any
+try:
+    import numpy as np
+except ImportError:  # Optional: array-backed embeddings and similarity
+    np = None
+
 
 class DocumentProcessor:
     """Processes Python documentation and creates searchable knowledge base"""
@@ -238,20 +244,23 @@ class DocumentProcessor:
         """Create searchable index of documentation"""
         print("🔍 Creating document index...")
         
+        # Combine all text content
+        combined_texts = []
         for doc in docs:
-            doc_id = doc['id']
-            
-            # Combine all text content
             full_text = doc['content']
             section_texts = [s['title'] for s in doc['sections']]
             function_names = [f['name'] for f in doc['functions']]
             class_names = [c['name'] for c in doc['classes']]
-            
-            combined_text = ' '.join([full_text] + section_texts + function_names + class_names)
+            combined_texts.append(' '.join([full_text] + section_texts + function_names + class_names))
+        
+        # Embeddings index into the vocabulary, so it is learned from the same texts
+        self.vectorizer.fit(combined_texts)
+        
+        for doc, combined_text in zip(docs, combined_texts):
+            doc_id = doc['id']
             
             # Create embedding
-            embedding = self.vectorizer.vectorize(combined_text)
-            self.doc_embeddings[doc_id] = embedding
+            self.doc_embeddings[doc_id] = self._embed(combined_text)
             
             # Create keyword index
             self.doc_index[doc_id] = {
@@ -271,9 +280,18 @@ class DocumentProcessor:
         with gzip.open(docs_file, 'wt') as f:
             json.dump(docs, f)
         
-        # Save embeddings
+        # Save embeddings along with the vectorizer whose vocabulary they index.
+        # They are stored as word -> weight dicts, so an index built with NumPy
+        # also loads without it; load_processed_docs converts them back
+        embeddings = self.doc_embeddings
+        if np is not None:
+            words = list(self.vectorizer.vocabulary)  # Ordered by vocabulary index
+            embeddings = {
+                doc_id: {words[index]: weight for index, weight in zip(indices.tolist(), weights.tolist())}
+                for doc_id, (indices, weights) in self.doc_embeddings.items()
+            }
         with gzip.open(embeddings_file, 'wb') as f:
-            pickle.dump(self.doc_embeddings, f)
+            pickle.dump({'vectorizer': self.vectorizer, 'embeddings': embeddings}, f)
         
         # Save index
         with open(index_file, 'w') as f:
@@ -293,7 +311,20 @@ class DocumentProcessor:
         try:
             # Load embeddings
             with gzip.open(embeddings_file, 'rb') as f:
-                self.doc_embeddings = pickle.load(f)
+                saved = pickle.load(f)
+            
+            if 'vectorizer' not in saved:
+                # Older files stored bare embeddings without their vocabulary
+                print("⚠️  Processed docs use an old format, please ingest the documentation again")
+                return False
+            self.vectorizer = saved['vectorizer']
+            self.doc_embeddings = saved['embeddings']
+            if np is not None:
+                # Embeddings saved without NumPy are word -> weight dicts
+                self.doc_embeddings = {
+                    doc_id: self.vectorizer.to_sparse(embedding) if isinstance(embedding, dict) else embedding
+                    for doc_id, embedding in self.doc_embeddings.items()
+                }
             
             # Load index
             with open(index_file, 'r') as f:
@@ -311,13 +342,25 @@ class DocumentProcessor:
         if not self.doc_embeddings:
             return []
         
-        query_embedding = self.vectorizer.vectorize(query)
+        query_embedding = self._embed(query)
         
         # Calculate similarities
         similarities = []
-        for doc_id, doc_embedding in self.doc_embeddings.items():
-            similarity = self._cosine_similarity(query_embedding, doc_embedding)
-            similarities.append((doc_id, similarity))
+        if np is not None:
+            # Scatter the query into a dense vector once; each document then
+            # gathers its own entries and takes a single dot product
+            indices, weights = query_embedding
+            query_dense = np.zeros(len(self.vectorizer.vocabulary), dtype=np.float32)
+            query_dense[indices] = weights
+            query_norm = np.linalg.norm(weights)
+            for doc_id, (doc_indices, doc_weights) in self.doc_embeddings.items():
+                norm = query_norm * np.linalg.norm(doc_weights)
+                similarity = float(query_dense[doc_indices] @ doc_weights / norm) if norm else 0.0
+                similarities.append((doc_id, similarity))
+        else:
+            for doc_id, doc_embedding in self.doc_embeddings.items():
+                similarity = self._cosine_similarity(query_embedding, doc_embedding)
+                similarities.append((doc_id, similarity))
         
         # Sort by similarity
         similarities.sort(key=lambda x: x[1], reverse=True)
@@ -333,6 +376,12 @@ class DocumentProcessor:
         
         return results
     
+    def _embed(self, text: str):
+        """Vectorize text as (indices, weights) arrays when NumPy is available, else as a dict"""
+        if np is not None:
+            return self.vectorizer.vectorize_sparse(text)
+        return self.vectorizer.vectorize(text)
+    
     def _cosine_similarity(self, vec1: Dict, vec2: Dict) -> float:
         """Calculate cosine similarity between two sparse vectors"""
         # Get intersection of keys
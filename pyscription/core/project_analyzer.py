@@ -5,22 +5,201 @@ Analyzes entire Python projects to understand architecture, patterns, and relati
 
 import ast
 import os
+import functools
 from pathlib import Path
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, DefaultDict, List, Any, Callable, Optional, Set, Tuple, Union, cast
 from collections import defaultdict, Counter
+from types import ModuleType, SimpleNamespace
 import json
 
+try:
+    import pathspec
+except ImportError:  # Optional: honours .gitignore files when gathering project files
+    pathspec = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Optional[ModuleType]:
+    """Import numpy on first use, so importing the analyzer does not pay for it"""
+    try:
+        import numpy
+    except ImportError:  # Optional: vectorizes the recommendation filters on large projects
+        return None
+    return numpy
+
+
+class _FusedCollector(ast.NodeVisitor):
+    """Collects every per-file metric in a single traversal of a module AST"""
+    
+    def __init__(self, analyzer: 'ProjectAnalyzer'):
+        self.analyzer = analyzer
+        self.functions: List[Dict] = []
+        self.classes: List[Dict] = []
+        self.imports: List[Dict] = []
+        self.complexity = 1  # Base complexity
+        self.docstrings = {'module': 0, 'functions': 0, 'classes': 0}
+        self.decorators: List[str] = []
+        self.async_usage = {'async_functions': 0, 'await_expressions': 0}
+        self.error_handling = {'try_blocks': 0, 'except_blocks': 0, 'finally_blocks': 0, 'raise_statements': 0}
+        # Branch counters of the functions currently being visited (innermost last)
+        self._open_functions: List[Dict] = []
+        # Bound handlers cached per node type; NodeVisitor.visit would build a
+        # method name and getattr() it for every node
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.If: self.visit_branch,
+            ast.For: self.visit_branch,
+            ast.While: self.visit_branch,
+            ast.With: self.visit_With,
+            ast.Try: self.visit_Try,
+            ast.BoolOp: self.visit_BoolOp,
+            ast.Await: self.visit_Await,
+            ast.Raise: self.visit_Raise,
+        }
+    
+    def collect(self, tree: ast.Module) -> Dict[str, Any]:
+        """Traverse the module once and return the per-file metrics"""
+        if _has_docstring(tree):
+            self.docstrings['module'] = 1
+        self.visit(tree)
+        return {
+            'functions': self.functions,
+            'classes': self.classes,
+            'imports': self.imports,
+            'complexity': self.complexity,
+            'docstrings': self.docstrings,
+            'decorators': self.decorators,
+            'async_usage': self.async_usage,
+            'error_handling': self.error_handling
+        }
+    
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+        else:
+            self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+                          is_async: bool = False) -> None:
+        decorators = [self.analyzer._get_decorator_name(d) for d in node.decorator_list]
+        function = {
+            'name': node.name,
+            'args': len(node.args.args),
+            'is_async': is_async,
+            'decorators': decorators,
+            'line_number': node.lineno,
+            'complexity': 0
+        }
+        self.functions.append(function)
+        self.decorators.extend(decorators)
+        if _has_docstring(node):
+            self.docstrings['functions'] += 1
+        
+        # Branches inside nested functions also count towards the outer ones
+        self._open_functions.append(function)
+        self.generic_visit(node)
+        self._open_functions.pop()
+    
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.async_usage['async_functions'] += 1
+        self.visit_FunctionDef(node, is_async=True)
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        methods = [n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        decorators = [self.analyzer._get_decorator_name(d) for d in node.decorator_list]
+        self.classes.append({
+            'name': node.name,
+            'bases': [self.analyzer._get_base_name(base) for base in node.bases],
+            'methods': len(methods),
+            'decorators': decorators,
+            'line_number': node.lineno,
+            'method_names': [m.name for m in methods]
+        })
+        self.decorators.extend(decorators)
+        if _has_docstring(node):
+            self.docstrings['classes'] += 1
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.append({
+                'type': 'import',
+                'module': alias.name,
+                'alias': alias.asname,
+                'line_number': node.lineno
+            })
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ''
+        for alias in node.names:
+            self.imports.append({
+                'type': 'from_import',
+                'module': module,
+                'name': alias.name,
+                'alias': alias.asname,
+                'level': node.level,
+                'line_number': node.lineno
+            })
+    
+    def visit_branch(self, node: ast.AST) -> None:
+        """If/For/While add to both file and enclosing-function complexity"""
+        self.complexity += 1
+        for function in self._open_functions:
+            function['complexity'] += 1
+        self.generic_visit(node)
+    
+    def visit_With(self, node: ast.With) -> None:
+        self.complexity += 1
+        self.generic_visit(node)
+    
+    def visit_Try(self, node: ast.Try) -> None:
+        self.complexity += 1
+        self.error_handling['try_blocks'] += 1
+        self.error_handling['except_blocks'] += len(node.handlers)
+        if node.finalbody:
+            self.error_handling['finally_blocks'] += 1
+        self.generic_visit(node)
+    
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+    
+    def visit_Await(self, node: ast.Await) -> None:
+        self.async_usage['await_expressions'] += 1
+        self.generic_visit(node)
+    
+    def visit_Raise(self, node: ast.Raise) -> None:
+        self.error_handling['raise_statements'] += 1
+        self.generic_visit(node)
+
+
+def _has_docstring(node: Union[ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
+    """Check whether a module, class or function body starts with a string literal"""
+    body = node.body
+    return bool(body and isinstance(body[0], ast.Expr) and
+                isinstance(body[0].value, ast.Constant) and
+                isinstance(body[0].value.value, str))
+
 
 class ProjectAnalyzer:
     """Analyzes entire Python projects for architecture patterns and relationships"""
     
+    MVC_INDICATORS = ('model', 'view', 'controller', 'models', 'views', 'controllers')
+    LAYER_INDICATORS = ('service', 'repository', 'dao', 'controller', 'handler', 'util')
+    MICROSERVICE_INDICATORS = ('api', 'service', 'handler', 'endpoint', 'router')
+    
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
-        self.analysis_cache = {}
-        self.file_dependencies = defaultdict(set)
-        self.class_hierarchy = defaultdict(list)
-        self.function_calls = defaultdict(set)
-        self.import_graph = defaultdict(set)
+        self.analysis_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self.file_dependencies: DefaultDict[str, Set[str]] = defaultdict(set)
+        self.class_hierarchy: DefaultDict[str, List[str]] = defaultdict(list)
+        self.function_calls: DefaultDict[str, Set[str]] = defaultdict(set)
+        self.import_graph: DefaultDict[str, Set[str]] = defaultdict(set)
         
     def analyze_project(self) -> Dict[str, Any]:
         """Perform comprehensive project analysis"""
@@ -30,23 +209,37 @@ class ProjectAnalyzer:
         python_files = self._find_python_files()
         print(f"📁 Found {len(python_files)} Python files")
         
-        # Analyze each file
+        # Analyze each file, recording the per-file metrics column-wise as we go
         file_analyses = {}
+        metrics = SimpleNamespace(
+            files=[], syntax_valid=[], loc=[], n_functions=[], n_classes=[],
+            complexities=[], docstrings=[], try_blocks=[]
+        )
         for file_path in python_files:
             try:
                 analysis = self._analyze_file(file_path)
-                file_analyses[str(file_path.relative_to(self.project_path))] = analysis
+                filename = str(file_path.relative_to(self.project_path))
+                file_analyses[filename] = analysis
+                self._record_metrics(metrics, filename, analysis)
             except Exception as e:
                 print(f"⚠️  Error analyzing {file_path}: {e}")
         
+        # Files that failed to parse only matter for the summary's error count,
+        # module naming and the path-based architecture hints, so the AST-based
+        # detectors skip them
+        valid_analyses = {
+            filename: analysis for filename, analysis in file_analyses.items()
+            if analysis.get('syntax_valid', True)
+        }
+        
         # Build project-wide insights
         project_analysis = {
             'files': file_analyses,
-            'summary': self._build_project_summary(file_analyses),
-            'architecture': self._analyze_architecture(file_analyses),
-            'patterns': self._discover_project_patterns(file_analyses),
+            'summary': self._build_project_summary(metrics),
+            'architecture': self._analyze_architecture(file_analyses, valid_analyses),
+            'patterns': self._discover_project_patterns(valid_analyses),
             'dependencies': self._analyze_dependencies(file_analyses),
-            'recommendations': self._generate_recommendations(file_analyses)
+            'recommendations': self._generate_recommendations(metrics)
         }
         
         return project_analysis
@@ -54,163 +247,79 @@ class ProjectAnalyzer:
     def _find_python_files(self) -> List[Path]:
         """Find all Python files in the project"""
         python_files = []
-        for file_path in self.project_path.rglob('*.py'):
-            # Skip common directories
-            if any(part.startswith('.') for part in file_path.parts):
-                continue
-            if any(part in ['__pycache__', 'venv', 'env', 'node_modules'] for part in file_path.parts):
-                continue
-            python_files.append(file_path)
+        # (directory relative to the project root, compiled spec) for every .gitignore seen
+        ignore_specs: List[Tuple[str, Any]] = []
+        for dirpath, dirnames, filenames in os.walk(self.project_path):
+            rel_dir = os.path.relpath(dirpath, self.project_path)
+            rel_dir = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+            if pathspec is not None and '.gitignore' in filenames:
+                spec = self._load_gitignore(Path(dirpath) / '.gitignore')
+                if spec is not None:
+                    ignore_specs.append((rel_dir, spec))
+            
+            # Prune skipped directories here so their contents are never walked
+            dirnames[:] = [
+                name for name in dirnames
+                if not name.startswith('.')
+                and name not in ['__pycache__', 'venv', 'env', 'node_modules']
+                and not self._is_gitignored(rel_dir + name + '/', ignore_specs)
+            ]
+            
+            for name in filenames:
+                if name.endswith('.py') and not name.startswith('.'):
+                    if not self._is_gitignored(rel_dir + name, ignore_specs):
+                        python_files.append(Path(dirpath) / name)
         return python_files
     
+    def _load_gitignore(self, gitignore_path: Path) -> Optional[Any]:
+        """Compile a .gitignore file into a PathSpec, or None if it can't be read"""
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return pathspec.PathSpec.from_lines('gitwildmatch', f)
+        except OSError:
+            return None
+    
+    def _is_gitignored(self, rel_path: str, ignore_specs: List[Tuple[str, Any]]) -> bool:
+        """Check a project-relative path against the .gitignore files above it"""
+        for base, spec in ignore_specs:
+            if rel_path.startswith(base) and spec.match_file(rel_path[len(base):]):
+                return True
+        return False
+    
     def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
         """Analyze a single Python file"""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # Reuse the previous result while the file is unchanged on disk
+        stat = os.stat(file_path)
+        cache_key = str(file_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        # Binary read + explicit decode skips the text-mode line buffering
+        # and newline translation layers
+        content = file_path.read_bytes().decode('utf-8', errors='ignore')
         
         try:
-            tree = ast.parse(content)
+            # compile() directly skips the ast.parse() wrapper and puts the
+            # filename into SyntaxError messages. The C parser also beats the
+            # pure-Python tokenize module, even when only keyword counts are needed
+            tree = compile(content, str(file_path), 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
         except SyntaxError as e:
-            return {'error': str(e), 'syntax_valid': False}
+            analysis = {'error': str(e), 'syntax_valid': False}
+            self.analysis_cache[cache_key] = (stamp, analysis)
+            return analysis
         
         analysis = {
             'syntax_valid': True,
-            'lines_of_code': len([line for line in content.split('\n') if line.strip()]),
-            'functions': self._extract_functions(tree),
-            'classes': self._extract_classes(tree),
-            'imports': self._extract_imports(tree),
-            'complexity': self._calculate_complexity(tree),
-            'docstrings': self._extract_docstrings(tree),
-            'decorators': self._extract_decorators(tree),
-            'async_usage': self._detect_async_usage(tree),
-            'error_handling': self._analyze_error_handling(tree)
+            'lines_of_code': sum(1 for line in content.splitlines() if line and not line.isspace()),
+            **_FusedCollector(self).collect(cast(ast.Module, tree))
         }
         
+        self.analysis_cache[cache_key] = (stamp, analysis)
         return analysis
     
-    def _extract_functions(self, tree) -> List[Dict]:
-        """Extract function information from AST"""
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                functions.append({
-                    'name': node.name,
-                    'args': len(node.args.args),
-                    'is_async': isinstance(node, ast.AsyncFunctionDef),
-                    'decorators': [self._get_decorator_name(d) for d in node.decorator_list],
-                    'line_number': node.lineno,
-                    'complexity': len([n for n in ast.walk(node) if isinstance(n, (ast.If, ast.For, ast.While))])
-                })
-        return functions
-    
-    def _extract_classes(self, tree) -> List[Dict]:
-        """Extract class information from AST"""
-        classes = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                classes.append({
-                    'name': node.name,
-                    'bases': [self._get_base_name(base) for base in node.bases],
-                    'methods': len(methods),
-                    'decorators': [self._get_decorator_name(d) for d in node.decorator_list],
-                    'line_number': node.lineno,
-                    'method_names': [m.name for m in methods]
-                })
-        return classes
-    
-    def _extract_imports(self, tree) -> List[Dict]:
-        """Extract import information from AST"""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append({
-                        'type': 'import',
-                        'module': alias.name,
-                        'alias': alias.asname,
-                        'line_number': node.lineno
-                    })
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                for alias in node.names:
-                    imports.append({
-                        'type': 'from_import',
-                        'module': module,
-                        'name': alias.name,
-                        'alias': alias.asname,
-                        'line_number': node.lineno
-                    })
-        return imports
-    
-    def _calculate_complexity(self, tree) -> int:
-        """Calculate cyclomatic complexity"""
-        complexity = 1  # Base complexity
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.With, ast.Try)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-        return complexity
-    
-    def _extract_docstrings(self, tree) -> Dict[str, int]:
-        """Extract docstring information"""
-        docstrings = {'module': 0, 'functions': 0, 'classes': 0}
-        
-        # Module docstring
-        if (isinstance(tree.body[0], ast.Expr) and 
-            isinstance(tree.body[0].value, ast.Constant) and 
-            isinstance(tree.body[0].value.value, str)):
-            docstrings['module'] = 1
-        
-        # Function and class docstrings
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant) and
-                    isinstance(node.body[0].value.value, str)):
-                    docstrings['functions'] += 1
-            elif isinstance(node, ast.ClassDef):
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant) and
-                    isinstance(node.body[0].value.value, str)):
-                    docstrings['classes'] += 1
-        
-        return docstrings
-    
-    def _extract_decorators(self, tree) -> List[str]:
-        """Extract decorator usage"""
-        decorators = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                for decorator in node.decorator_list:
-                    decorators.append(self._get_decorator_name(decorator))
-        return decorators
-    
-    def _detect_async_usage(self, tree) -> Dict[str, int]:
-        """Detect async/await usage"""
-        async_usage = {'async_functions': 0, 'await_expressions': 0}
-        for node in ast.walk(tree):
-            if isinstance(node, ast.AsyncFunctionDef):
-                async_usage['async_functions'] += 1
-            elif isinstance(node, ast.Await):
-                async_usage['await_expressions'] += 1
-        return async_usage
-    
-    def _analyze_error_handling(self, tree) -> Dict[str, int]:
-        """Analyze error handling patterns"""
-        error_handling = {'try_blocks': 0, 'except_blocks': 0, 'finally_blocks': 0, 'raise_statements': 0}
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Try):
-                error_handling['try_blocks'] += 1
-                error_handling['except_blocks'] += len(node.handlers)
-                if node.finalbody:
-                    error_handling['finally_blocks'] += 1
-            elif isinstance(node, ast.Raise):
-                error_handling['raise_statements'] += 1
-        return error_handling
-    
-    def _get_decorator_name(self, decorator) -> str:
+    def _get_decorator_name(self, decorator: ast.expr) -> str:
         """Get decorator name from AST node"""
         if isinstance(decorator, ast.Name):
             return decorator.id
@@ -220,7 +329,7 @@ class ProjectAnalyzer:
             return self._get_decorator_name(decorator.func)
         return str(decorator)
     
-    def _get_base_name(self, base) -> str:
+    def _get_base_name(self, base: ast.expr) -> str:
         """Get base class name from AST node"""
         if isinstance(base, ast.Name):
             return base.id
@@ -228,34 +337,43 @@ class ProjectAnalyzer:
             return f"{base.value.id}.{base.attr}" if hasattr(base.value, 'id') else base.attr
         return str(base)
     
-    def _build_project_summary(self, file_analyses: Dict) -> Dict[str, Any]:
+    def _record_metrics(self, metrics: SimpleNamespace, filename: str, analysis: Dict) -> None:
+        """Append one file's aggregate metrics to the column lists"""
+        metrics.files.append(filename)
+        metrics.syntax_valid.append(analysis.get('syntax_valid', True))
+        metrics.loc.append(analysis.get('lines_of_code', 0))
+        metrics.n_functions.append(len(analysis.get('functions', ())))
+        metrics.n_classes.append(len(analysis.get('classes', ())))
+        metrics.complexities.append(analysis.get('complexity', 1))
+        metrics.docstrings.append(sum(analysis.get('docstrings', {}).values()))
+        metrics.try_blocks.append(analysis.get('error_handling', {}).get('try_blocks', 0))
+    
+    def _build_project_summary(self, metrics: SimpleNamespace) -> Dict[str, Any]:
         """Build high-level project summary"""
-        total_files = len(file_analyses)
-        total_loc = sum(analysis.get('lines_of_code', 0) for analysis in file_analyses.values())
-        total_functions = sum(len(analysis.get('functions', [])) for analysis in file_analyses.values())
-        total_classes = sum(len(analysis.get('classes', [])) for analysis in file_analyses.values())
+        total_files = len(metrics.files)
         
         # Average complexity
-        complexities = [analysis.get('complexity', 1) for analysis in file_analyses.values()]
-        avg_complexity = sum(complexities) / len(complexities) if complexities else 1
+        avg_complexity = sum(metrics.complexities) / total_files if total_files else 1
         
         return {
             'total_files': total_files,
-            'total_lines_of_code': total_loc,
-            'total_functions': total_functions,
-            'total_classes': total_classes,
+            'total_lines_of_code': sum(metrics.loc),
+            'total_functions': sum(metrics.n_functions),
+            'total_classes': sum(metrics.n_classes),
             'average_complexity': round(avg_complexity, 2),
-            'files_with_errors': len([a for a in file_analyses.values() if not a.get('syntax_valid', True)])
+            'files_with_errors': metrics.syntax_valid.count(False)
         }
     
-    def _analyze_architecture(self, file_analyses: Dict) -> Dict[str, Any]:
+    def _analyze_architecture(self, file_analyses: Dict, valid_analyses: Dict) -> Dict[str, Any]:
         """Analyze project architecture patterns"""
-        # Identify common architectural patterns
+        # Identify common architectural patterns; the styles only look at file
+        # paths, so files that failed to parse still count
+        mvc, layered, microservices = self._detect_architecture_styles(file_analyses)
         patterns = {
-            'mvc_pattern': self._detect_mvc_pattern(file_analyses),
-            'layered_architecture': self._detect_layered_architecture(file_analyses),
-            'microservices_hints': self._detect_microservices_patterns(file_analyses),
-            'design_patterns': self._detect_design_patterns(file_analyses)
+            'mvc_pattern': mvc,
+            'layered_architecture': layered,
+            'microservices_hints': microservices,
+            'design_patterns': self._detect_design_patterns(valid_analyses)
         }
         
         return patterns
@@ -302,10 +420,28 @@ class ProjectAnalyzer:
         external_imports = set()
         internal_imports = set()
         
+        # Top-level packages/modules defined by the project itself
+        top_level_packages = set()
+        for filename in file_analyses:
+            root = Path(filename).parts[0]
+            top_level_packages.add(root[:-3] if root.endswith('.py') else root)
+        
+        # Classification per distinct module name, shared by every import of it
+        is_internal_module: Dict[str, bool] = {}
         for analysis in file_analyses.values():
             for imp in analysis.get('imports', []):
                 module = imp['module']
-                if module.startswith('.') or any(file.startswith(module.replace('.', '/')) for file in file_analyses.keys()):
+                # Relative imports are always internal; keep their leading dots
+                level = imp.get('level', 0)
+                if level:
+                    internal_imports.add('.' * level + module)
+                    continue
+                
+                is_internal = is_internal_module.get(module)
+                if is_internal is None:
+                    is_internal = module.split('.', 1)[0] in top_level_packages
+                    is_internal_module[module] = is_internal
+                if is_internal:
                     internal_imports.add(module)
                 else:
                     external_imports.add(module)
@@ -317,15 +453,35 @@ class ProjectAnalyzer:
             'coupling_score': len(internal_imports) / len(file_analyses) if file_analyses else 0
         }
     
-    def _generate_recommendations(self, file_analyses: Dict) -> List[Dict]:
+    def _find_recommendation_candidates(self, metrics: SimpleNamespace) -> Tuple[List[int], List[int], List[int]]:
+        """Return indices of parsable files with high complexity, no docstrings and no error handling"""
+        np = _numpy()
+        if np is not None:
+            valid = np.asarray(metrics.syntax_valid, dtype=bool)
+            try_blocks = np.asarray(metrics.try_blocks)
+            return (
+                np.flatnonzero((np.asarray(metrics.complexities) > 10) & valid).tolist(),
+                np.flatnonzero((np.asarray(metrics.docstrings) == 0) & valid).tolist(),
+                np.flatnonzero((try_blocks == 0) & (np.asarray(metrics.n_functions) > 3) & valid).tolist()
+            )
+        
+        valid = metrics.syntax_valid
+        return (
+            [i for i, complexity in enumerate(metrics.complexities) if complexity > 10 and valid[i]],
+            [i for i, docstrings in enumerate(metrics.docstrings) if docstrings == 0 and valid[i]],
+            [i for i, try_blocks in enumerate(metrics.try_blocks)
+             if try_blocks == 0 and metrics.n_functions[i] > 3 and valid[i]]
+        )
+    
+    def _generate_recommendations(self, metrics: SimpleNamespace) -> List[Dict]:
         """Generate improvement recommendations"""
         recommendations = []
+        files = metrics.files
+        valid_count = metrics.syntax_valid.count(True)
+        high_complexity, without_docs, without_error_handling = self._find_recommendation_candidates(metrics)
         
         # Check for high complexity files
-        high_complexity_files = [
-            (filename, analysis) for filename, analysis in file_analyses.items()
-            if analysis.get('complexity', 1) > 10
-        ]
+        high_complexity_files = [files[i] for i in high_complexity]
         
         if high_complexity_files:
             recommendations.append({
@@ -333,17 +489,14 @@ class ProjectAnalyzer:
                 'priority': 'high',
                 'title': 'High Complexity Files',
                 'description': f"Found {len(high_complexity_files)} files with high complexity",
-                'files': [filename for filename, _ in high_complexity_files[:5]],
+                'files': high_complexity_files[:5],
                 'suggestion': 'Consider breaking down complex functions and reducing nesting'
             })
         
         # Check for missing docstrings
-        files_without_docs = [
-            filename for filename, analysis in file_analyses.items()
-            if sum(analysis.get('docstrings', {}).values()) == 0
-        ]
+        files_without_docs = [files[i] for i in without_docs]
         
-        if len(files_without_docs) > len(file_analyses) * 0.5:
+        if len(files_without_docs) > valid_count * 0.5:
             recommendations.append({
                 'type': 'documentation',
                 'priority': 'medium',
@@ -353,11 +506,7 @@ class ProjectAnalyzer:
             })
         
         # Check for error handling
-        files_without_error_handling = [
-            filename for filename, analysis in file_analyses.items()
-            if analysis.get('error_handling', {}).get('try_blocks', 0) == 0 and
-            len(analysis.get('functions', [])) > 3
-        ]
+        files_without_error_handling = [files[i] for i in without_error_handling]
         
         if files_without_error_handling:
             recommendations.append({
@@ -370,23 +519,20 @@ class ProjectAnalyzer:
         
         return recommendations
     
-    def _detect_mvc_pattern(self, file_analyses: Dict) -> bool:
-        """Detect MVC architecture pattern"""
-        mvc_indicators = ['model', 'view', 'controller', 'models', 'views', 'controllers']
-        file_paths = list(file_analyses.keys())
-        return any(indicator in path.lower() for path in file_paths for indicator in mvc_indicators)
-    
-    def _detect_layered_architecture(self, file_analyses: Dict) -> bool:
-        """Detect layered architecture pattern"""
-        layer_indicators = ['service', 'repository', 'dao', 'controller', 'handler', 'util']
-        file_paths = list(file_analyses.keys())
-        return any(indicator in path.lower() for path in file_paths for indicator in layer_indicators)
-    
-    def _detect_microservices_patterns(self, file_analyses: Dict) -> bool:
-        """Detect microservices architecture hints"""
-        microservice_indicators = ['api', 'service', 'handler', 'endpoint', 'router']
-        file_paths = list(file_analyses.keys())
-        return any(indicator in path.lower() for path in file_paths for indicator in microservice_indicators)
+    def _detect_architecture_styles(self, file_analyses: Dict) -> Tuple[bool, bool, bool]:
+        """Detect MVC, layered and microservices hints in a single pass over file paths"""
+        mvc = layered = microservices = False
+        for path in file_analyses:
+            path = path.lower()
+            if not mvc:
+                mvc = any(indicator in path for indicator in self.MVC_INDICATORS)
+            if not layered:
+                layered = any(indicator in path for indicator in self.LAYER_INDICATORS)
+            if not microservices:
+                microservices = any(indicator in path for indicator in self.MICROSERVICE_INDICATORS)
+            if mvc and layered and microservices:
+                break
+        return mvc, layered, microservices
     
     def _detect_design_patterns(self, file_analyses: Dict) -> List[str]:
         """Detect design patterns in the codebase"""
@@ -416,10 +562,19 @@ class ProjectAnalyzer:
         if not names:
             return ""
         
-        # Check for consistent patterns
-        snake_case = sum(1 for name in names if '_' in name and name.islower())
-        camel_case = sum(1 for name in names if name[0].islower() and any(c.isupper() for c in name[1:]))
-        pascal_case = sum(1 for name in names if name[0].isupper() and any(c.isupper() for c in name[1:]))
+        # Check for consistent patterns, classifying every name in one pass
+        snake_case = camel_case = pascal_case = 0
+        for name in names:
+            if '_' in name and name.islower():
+                snake_case += 1
+            first = name[0]
+            first_lower = first.islower()
+            if first_lower or first.isupper():
+                if any(c.isupper() for c in name[1:]):
+                    if first_lower:
+                        camel_case += 1
+                    else:
+                        pascal_case += 1
         
         total = len(names)
         
@@ -435,11 +590,12 @@ class ProjectAnalyzer:
     def _analyze_import_patterns(self, file_analyses: Dict) -> List[Dict]:
         """Analyze import patterns across the project"""
         patterns = []
-        import_counter = Counter()
+        import_counter: Counter[str] = Counter()
         
-        for analysis in file_analyses.values():
-            for imp in analysis.get('imports', []):
-                import_counter[imp['module']] += 1
+        # Counter.update tallies the whole stream in C
+        import_counter.update(
+            imp['module'] for analysis in file_analyses.values() for imp in analysis.get('imports', ())
+        )
         
         # Find commonly used modules
         common_imports = [module for module, count in import_counter.most_common(10) if count > 1]
@@ -4,9 +4,18 @@ Analyzes Python code for common security issues and vulnerabilities
 """
 
 import ast
+import atexit
+import copy
 import re
+import shelve
+import hashlib
+import sys
 import json
-from typing import Dict, List, Any, Set, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Any, Callable, Optional, Pattern, Tuple, Union, cast
 from dataclasses import dataclass
 from enum import Enum
 
@@ -18,7 +27,18 @@ class VulnerabilityLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Sort rank per severity, most severe first
+_SEVERITY_RANK = {
+    VulnerabilityLevel.CRITICAL: 0,
+    VulnerabilityLevel.HIGH: 1,
+    VulnerabilityLevel.MEDIUM: 2,
+    VulnerabilityLevel.LOW: 3
+}
+
+
+# Scans can produce thousands of issues; slots drop the per-instance __dict__
+# where dataclasses support them (Python 3.10+)
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class SecurityIssue:
     """Represents a security vulnerability or issue"""
     issue_type: str
@@ -31,40 +51,351 @@ class SecurityIssue:
     owasp_category: str = ""
 
 
+def _snippet(lines: List[str], line_number: int) -> str:
+    """Return the source line at a 1-based line number, or "" if out of range"""
+    if 0 < line_number <= len(lines):
+        # Lines come from split('\n'), which leaves the '\r' of CRLF files
+        return lines[line_number - 1].rstrip('\r')
+    return ""
+
+
+# Escapes such as \S, \W or \N{...} mean something else once lowercased
+_UPPERCASE_ESCAPE = re.compile(r'\\[A-Z]')
+
+
+def _compile_prefilter(pattern: str) -> Pattern[str]:
+    """Compile a pattern that matches a superset of its lines in lowercased text"""
+    # Matching the lowercased source case-sensitively lets the engine jump to
+    # literal prefixes, but that is only equivalent without uppercase escapes
+    if _UPPERCASE_ESCAPE.search(pattern):
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern.lower())
+
+
+def _decorator_name(decorator: ast.AST) -> str:
+    """Return the bare name of a decorator: 'trusted' for @trusted, @checks.trusted or @trusted()"""
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return ""
+
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """Runs every AST-based security check in a single traversal of a module"""
+    
+    SECRET_KEYWORDS = ['password', 'pwd', 'secret', 'api_key', 'token', 'key', 'auth']
+    # One C-level search instead of a Python loop over the keywords
+    SECRET_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, SECRET_KEYWORDS)))
+    COMMAND_FUNCTIONS = ['system', 'popen', 'call', 'run', 'Popen']
+    FILE_FUNCTIONS = ['open', 'read', 'write', 'remove', 'unlink']
+    
+    def __init__(self, analyzer: 'SecurityPatternAnalyzer', lines: List[str]):
+        self.dangerous_imports = analyzer.dangerous_imports
+        self.skip_decorators = analyzer.skip_decorators
+        self.lines = lines
+        self.issues: List[SecurityIssue] = []
+        # (first, last) line of every function skipped because of its decorators
+        self.skipped_ranges: List[Tuple[int, int]] = []
+        # Bound handlers cached per node type; NodeVisitor.visit would build a
+        # method name and getattr() it for every node
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.Assign: self.visit_Assign,
+            ast.Call: self.visit_Call,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_FunctionDef,
+        }
+        # Second level for calls, keyed on the type of the callee expression
+        self._call_dispatch: Dict[type, Callable[[ast.Call, Any], None]] = {
+            ast.Name: self._check_name_call,
+            ast.Attribute: self._check_attribute_call,
+        }
+    
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+        else:
+            self.generic_visit(node)
+    
+    def _report(self, node: Union[ast.stmt, ast.expr], **fields: Any) -> None:
+        """Record an issue located at node"""
+        self.issues.append(SecurityIssue(
+            line_number=node.lineno,
+            code_snippet=_snippet(self.lines, node.lineno),
+            **fields
+        ))
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Don't descend into functions marked as exempt from security checks
+        if any(_decorator_name(d) in self.skip_decorators for d in node.decorator_list):
+            self.skipped_ranges.append((node.lineno, node.end_lineno or node.lineno))
+            return
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        # Check for dangerous imports
+        for alias in node.names:
+            if alias.name in self.dangerous_imports:
+                danger_info = self.dangerous_imports[alias.name]
+                self._report(
+                    node,
+                    issue_type="dangerous_import",
+                    severity=danger_info['severity'],
+                    description=f"Dangerous import: {alias.name} - {danger_info['description']}",
+                    recommendation=danger_info['recommendation'],
+                    cwe_id=danger_info['cwe_id']
+                )
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # Check for hardcoded secrets and credentials
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            if len(node.value.value) > 3:  # Ignore very short strings
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        if self.SECRET_KEYWORD_PATTERN.search(target.id.lower()):
+                            self._report(
+                                node,
+                                issue_type="hardcoded_secret",
+                                severity=VulnerabilityLevel.HIGH,
+                                description=f"Hardcoded credential in variable '{target.id}'",
+                                recommendation="Use environment variables or secure credential management",
+                                cwe_id="CWE-798",
+                                owasp_category="A02:2021 – Cryptographic Failures"
+                            )
+        self.generic_visit(node)
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        check = self._call_dispatch.get(type(node.func))
+        if check is not None:
+            check(node, node.func)
+        self.generic_visit(node)
+    
+    def _check_name_call(self, node: ast.Call, func: ast.Name) -> None:
+        """Checks for calls of a bare name, e.g. eval(...)"""
+        self._check_dangerous_function(node, func.id)
+        self._check_command_injection(node, func.id)
+        self._check_path_traversal(node, func.id)
+    
+    def _check_attribute_call(self, node: ast.Call, func: ast.Attribute) -> None:
+        """Checks for calls of an attribute, e.g. cursor.execute(...)"""
+        self._check_sql_injection(node, func.attr)
+        self._check_command_injection(node, func.attr)
+        self._check_deserialization(node, func)
+        self._check_random_usage(node, func)
+        self._check_ssl_issues(node, func.attr)
+    
+    def _check_dangerous_function(self, node: ast.Call, func_name: str) -> None:
+        """Check for eval()/exec() calls"""
+        if func_name in ['eval', 'exec']:
+            danger_info = self.dangerous_imports[func_name]
+            self._report(
+                node,
+                issue_type="dangerous_function",
+                severity=danger_info['severity'],
+                description=f"Dangerous function: {func_name} - {danger_info['description']}",
+                recommendation=danger_info['recommendation'],
+                cwe_id=danger_info['cwe_id']
+            )
+    
+    def _check_sql_injection(self, node: ast.Call, attr: str) -> None:
+        """Check for cursor.execute with string formatting"""
+        if attr == 'execute':
+            for arg in node.args:
+                if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Mod):
+                    self._report(
+                        node,
+                        issue_type="sql_injection",
+                        severity=VulnerabilityLevel.CRITICAL,
+                        description="SQL query using string formatting - potential injection vulnerability",
+                        recommendation="Use parameterized queries with ? placeholders",
+                        cwe_id="CWE-89",
+                        owasp_category="A03:2021 – Injection"
+                    )
+    
+    def _check_command_injection(self, node: ast.Call, func_name: str) -> None:
+        """Check for command execution with string concatenation"""
+        if func_name in self.COMMAND_FUNCTIONS:
+            for arg in node.args:
+                if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Add):
+                    self._report(
+                        node,
+                        issue_type="command_injection",
+                        severity=VulnerabilityLevel.CRITICAL,
+                        description=f"Command execution with string concatenation in {func_name}()",
+                        recommendation="Use subprocess with list arguments and validate input",
+                        cwe_id="CWE-78",
+                        owasp_category="A03:2021 – Injection"
+                    )
+    
+    def _check_path_traversal(self, node: ast.Call, func_name: str) -> None:
+        """Check for file operations on dynamically built paths"""
+        if func_name in self.FILE_FUNCTIONS:
+            for arg in node.args:
+                if isinstance(arg, ast.BinOp):
+                    self._report(
+                        node,
+                        issue_type="path_traversal",
+                        severity=VulnerabilityLevel.MEDIUM,
+                        description=f"File operation with dynamic path in {func_name}()",
+                        recommendation="Validate and sanitize file paths, use os.path.basename()",
+                        cwe_id="CWE-22",
+                        owasp_category="A01:2021 – Broken Access Control"
+                    )
+    
+    def _check_deserialization(self, node: ast.Call, func: ast.Attribute) -> None:
+        """Check for unsafe pickle deserialization"""
+        if (func.attr in ['loads', 'load'] and
+            isinstance(func.value, ast.Name) and
+            func.value.id == 'pickle'):
+            self._report(
+                node,
+                issue_type="unsafe_deserialization",
+                severity=VulnerabilityLevel.CRITICAL,
+                description="Unsafe pickle deserialization - can execute arbitrary code",
+                recommendation="Use json or other safe serialization formats",
+                cwe_id="CWE-502",
+                owasp_category="A08:2021 – Software and Data Integrity Failures"
+            )
+    
+    def _check_random_usage(self, node: ast.Call, func: ast.Attribute) -> None:
+        """Check for weak random number generation"""
+        if isinstance(func.value, ast.Name) and func.value.id == 'random':
+            self._report(
+                node,
+                issue_type="weak_random",
+                severity=VulnerabilityLevel.MEDIUM,
+                description="Using random module for potentially security-sensitive operations",
+                recommendation="Use secrets module for cryptographically secure random numbers",
+                cwe_id="CWE-338",
+                owasp_category="A02:2021 – Cryptographic Failures"
+            )
+    
+    def _check_ssl_issues(self, node: ast.Call, attr: str) -> None:
+        """Check for SSL contexts with verification disabled"""
+        if attr == 'create_unverified_context':
+            self._report(
+                node,
+                issue_type="ssl_verification_disabled",
+                severity=VulnerabilityLevel.HIGH,
+                description="SSL certificate verification disabled",
+                recommendation="Use create_default_context() and enable certificate verification",
+                cwe_id="CWE-295",
+                owasp_category="A02:2021 – Cryptographic Failures"
+            )
+
+
 class SecurityPatternAnalyzer:
     """Analyzes Python code for security vulnerabilities"""
     
-    def __init__(self):
+    # Lines longer than this (minified or generated code) are not regex-scanned;
+    # patterns such as SELECT.*\+.*FROM backtrack polynomially in the line length
+    MAX_SCAN_LINE_LENGTH = 1024
+    
+    # Part of every result cache key; bump whenever patterns or checks change
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_path: Optional[str] = None):
         self.vulnerability_patterns = self._init_vulnerability_patterns()
+        # Compile the regex patterns once instead of on every line scanned. The
+        # prefilters search whole lowercased files for candidate lines
+        for pattern_info in self.vulnerability_patterns.values():
+            pattern_info['compiled'] = [re.compile(p, re.IGNORECASE) for p in pattern_info['patterns']]
+            pattern_info['prefilter'] = [_compile_prefilter(p) for p in pattern_info['patterns']]
         self.dangerous_imports = self._init_dangerous_imports()
         self.sql_injection_patterns = self._init_sql_patterns()
         self.command_injection_patterns = self._init_command_patterns()
+        # Functions carrying one of these decorators are not checked
+        self.skip_decorators = {'trusted', 'no_security_check'}
+        # Optional on-disk shelf of results keyed by source hash, so unchanged
+        # files are not re-analyzed across runs. It is closed by close_cache(),
+        # when a with block around the analyzer ends, or at interpreter exit
+        self.cache_path = cache_path
+        self._cache: Optional[shelve.Shelf] = None
+    
+    def __enter__(self) -> 'SecurityPatternAnalyzer':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close_cache()
         
-    def analyze_code_security(self, code: str, filename: str = "") -> List[SecurityIssue]:
+    def analyze_code_security(self, code: str, filename: str = "", tree: Optional[ast.AST] = None) -> List[SecurityIssue]:
         """Analyze code for security vulnerabilities"""
+        # Callers that already parsed the code for other analyses pass their
+        # module tree in, so the source is only parsed once
+        if self.cache_path is None:
+            return self._analyze_code(code, tree)
+        
+        if self._cache is None:
+            self._cache = shelve.open(self.cache_path)
+            atexit.register(self.close_cache)
+        key = self._cache_key(code)
+        issues: Optional[List[SecurityIssue]] = self._cache.get(key)
+        if issues is None:
+            issues = self._analyze_code(code, tree)
+            self._cache[key] = issues
+        return issues
+    
+    def close_cache(self) -> None:
+        """Flush and close the result cache, if one is open"""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+            atexit.unregister(self.close_cache)
+    
+    def _cache_key(self, code: str) -> str:
+        """Key results by source hash, analyzer version and skip decorators"""
+        digest = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+        return f"{self.CACHE_VERSION}:{','.join(sorted(self.skip_decorators))}:{digest}"
+    
+    def _analyze_code(self, code: str, tree: Optional[ast.AST] = None) -> List[SecurityIssue]:
+        """Run the AST and regex checks over a piece of code"""
         issues = []
         lines = code.split('\n')
         
         try:
-            tree = ast.parse(code)
+            if tree is None:
+                tree = ast.parse(code)
             
-            # AST-based analysis
-            issues.extend(self._analyze_dangerous_imports(tree, lines))
-            issues.extend(self._analyze_hardcoded_secrets(tree, lines))
-            issues.extend(self._analyze_sql_injection(tree, lines))
-            issues.extend(self._analyze_command_injection(tree, lines))
-            issues.extend(self._analyze_path_traversal(tree, lines))
-            issues.extend(self._analyze_deserialization(tree, lines))
-            issues.extend(self._analyze_random_usage(tree, lines))
-            issues.extend(self._analyze_ssl_issues(tree, lines))
+            # AST-based analysis, all checks in a single traversal
+            visitor = _SecurityVisitor(self, lines)
+            visitor.visit(tree)
+            issues.extend(visitor.issues)
+            skipped_ranges = visitor.skipped_ranges
             
         except SyntaxError:
-            pass  # Skip analysis for files with syntax errors
+            skipped_ranges = []  # Skip analysis for files with syntax errors
         
         # Regex-based analysis for patterns AST might miss
-        issues.extend(self._analyze_regex_patterns(code, lines))
+        regex_issues = self._analyze_regex_patterns(code, lines)
+        if skipped_ranges:
+            regex_issues = [
+                issue for issue in regex_issues
+                if not any(start <= issue.line_number <= end for start, end in skipped_ranges)
+            ]
+        issues.extend(regex_issues)
         
-        return sorted(issues, key=lambda x: (x.severity.value, x.line_number))
+        return sorted(issues, key=lambda x: (_SEVERITY_RANK[x.severity], x.line_number))
+    
+    def analyze_files(self, paths: List[str], max_workers: Optional[int] = None) -> Dict[str, List[SecurityIssue]]:
+        """Analyze many files in parallel, one analyzer per worker process"""
+        paths = [str(path) for path in paths]
+        if len(paths) < 2:
+            return {path: _analyze_path(path, self) for path in paths}
+        
+        # Workers get this analyzer's full configuration, so customized patterns
+        # give the same results as a serial run. The result cache stays in this
+        # process: one shelf can't be opened by several processes at once
+        worker_analyzer = copy.copy(self)
+        worker_analyzer.cache_path = None
+        worker_analyzer._cache = None
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(worker_analyzer,)) as executor:
+            results = executor.map(_analyze_path, paths, chunksize=8)
+            return dict(zip(paths, results))
     
     def _init_vulnerability_patterns(self) -> Dict[str, Dict]:
         """Initialize vulnerability detection patterns"""
@@ -156,233 +487,44 @@ class SecurityPatternAnalyzer:
             r'commands\.(getoutput|getstatusoutput)\s*\(\s*.*\+'
         ]
     
-    def _analyze_dangerous_imports(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for dangerous imports and function usage"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            # Check for dangerous imports
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name in self.dangerous_imports:
-                        danger_info = self.dangerous_imports[alias.name]
-                        issues.append(SecurityIssue(
-                            issue_type="dangerous_import",
-                            severity=danger_info['severity'],
-                            description=f"Dangerous import: {alias.name} - {danger_info['description']}",
-                            line_number=node.lineno,
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                            recommendation=danger_info['recommendation'],
-                            cwe_id=danger_info['cwe_id']
-                        ))
-            
-            # Check for dangerous function calls
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in ['eval', 'exec']:
-                        danger_info = self.dangerous_imports[node.func.id]
-                        issues.append(SecurityIssue(
-                            issue_type="dangerous_function",
-                            severity=danger_info['severity'],
-                            description=f"Dangerous function: {node.func.id} - {danger_info['description']}",
-                            line_number=node.lineno,
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                            recommendation=danger_info['recommendation'],
-                            cwe_id=danger_info['cwe_id']
-                        ))
-        
-        return issues
-    
-    def _analyze_hardcoded_secrets(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for hardcoded secrets and credentials"""
-        issues = []
-        secret_keywords = ['password', 'pwd', 'secret', 'api_key', 'token', 'key', 'auth']
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        var_name = target.id.lower()
-                        if any(keyword in var_name for keyword in secret_keywords):
-                            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                                if len(node.value.value) > 3:  # Ignore very short strings
-                                    issues.append(SecurityIssue(
-                                        issue_type="hardcoded_secret",
-                                        severity=VulnerabilityLevel.HIGH,
-                                        description=f"Hardcoded credential in variable '{target.id}'",
-                                        line_number=node.lineno,
-                                        code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                                        recommendation="Use environment variables or secure credential management",
-                                        cwe_id="CWE-798",
-                                        owasp_category="A02:2021 – Cryptographic Failures"
-                                    ))
-        
-        return issues
-    
-    def _analyze_sql_injection(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for SQL injection vulnerabilities"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check for cursor.execute with string formatting
-                if (isinstance(node.func, ast.Attribute) and 
-                    node.func.attr == 'execute'):
-                    for arg in node.args:
-                        if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Mod):
-                            issues.append(SecurityIssue(
-                                issue_type="sql_injection",
-                                severity=VulnerabilityLevel.CRITICAL,
-                                description="SQL query using string formatting - potential injection vulnerability",
-                                line_number=node.lineno,
-                                code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                                recommendation="Use parameterized queries with ? placeholders",
-                                cwe_id="CWE-89",
-                                owasp_category="A03:2021 – Injection"
-                            ))
-        
-        return issues
-    
-    def _analyze_command_injection(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for command injection vulnerabilities"""
-        issues = []
-        dangerous_functions = ['system', 'popen', 'call', 'run', 'Popen']
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = None
-                
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                elif isinstance(node.func, ast.Attribute):
-                    func_name = node.func.attr
-                
-                if func_name in dangerous_functions:
-                    # Check if arguments use string concatenation
-                    for arg in node.args:
-                        if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Add):
-                            issues.append(SecurityIssue(
-                                issue_type="command_injection",
-                                severity=VulnerabilityLevel.CRITICAL,
-                                description=f"Command execution with string concatenation in {func_name}()",
-                                line_number=node.lineno,
-                                code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                                recommendation="Use subprocess with list arguments and validate input",
-                                cwe_id="CWE-78",
-                                owasp_category="A03:2021 – Injection"
-                            ))
-        
-        return issues
-    
-    def _analyze_path_traversal(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for path traversal vulnerabilities"""
-        issues = []
-        file_functions = ['open', 'read', 'write', 'remove', 'unlink']
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id in file_functions:
-                    for arg in node.args:
-                        if isinstance(arg, ast.BinOp):
-                            issues.append(SecurityIssue(
-                                issue_type="path_traversal",
-                                severity=VulnerabilityLevel.MEDIUM,
-                                description=f"File operation with dynamic path in {node.func.id}()",
-                                line_number=node.lineno,
-                                code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                                recommendation="Validate and sanitize file paths, use os.path.basename()",
-                                cwe_id="CWE-22",
-                                owasp_category="A01:2021 – Broken Access Control"
-                            ))
-        
-        return issues
-    
-    def _analyze_deserialization(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for unsafe deserialization"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if (isinstance(node.func, ast.Attribute) and 
-                    node.func.attr in ['loads', 'load'] and
-                    isinstance(node.func.value, ast.Name) and
-                    node.func.value.id == 'pickle'):
-                    issues.append(SecurityIssue(
-                        issue_type="unsafe_deserialization",
-                        severity=VulnerabilityLevel.CRITICAL,
-                        description="Unsafe pickle deserialization - can execute arbitrary code",
-                        line_number=node.lineno,
-                        code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                        recommendation="Use json or other safe serialization formats",
-                        cwe_id="CWE-502",
-                        owasp_category="A08:2021 – Software and Data Integrity Failures"
-                    ))
-        
-        return issues
-    
-    def _analyze_random_usage(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for weak random number generation"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if (isinstance(node.func, ast.Attribute) and 
-                    isinstance(node.func.value, ast.Name) and
-                    node.func.value.id == 'random'):
-                    issues.append(SecurityIssue(
-                        issue_type="weak_random",
-                        severity=VulnerabilityLevel.MEDIUM,
-                        description="Using random module for potentially security-sensitive operations",
-                        line_number=node.lineno,
-                        code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                        recommendation="Use secrets module for cryptographically secure random numbers",
-                        cwe_id="CWE-338",
-                        owasp_category="A02:2021 – Cryptographic Failures"
-                    ))
-        
-        return issues
-    
-    def _analyze_ssl_issues(self, tree: ast.AST, lines: List[str]) -> List[SecurityIssue]:
-        """Analyze for SSL/TLS security issues"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check for SSL context with verification disabled
-                if (isinstance(node.func, ast.Attribute) and 
-                    node.func.attr in ['create_default_context', 'create_unverified_context']):
-                    if node.func.attr == 'create_unverified_context':
-                        issues.append(SecurityIssue(
-                            issue_type="ssl_verification_disabled",
-                            severity=VulnerabilityLevel.HIGH,
-                            description="SSL certificate verification disabled",
-                            line_number=node.lineno,
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else "",
-                            recommendation="Use create_default_context() and enable certificate verification",
-                            cwe_id="CWE-295",
-                            owasp_category="A02:2021 – Cryptographic Failures"
-                        ))
-        
-        return issues
-    
     def _analyze_regex_patterns(self, code: str, lines: List[str]) -> List[SecurityIssue]:
         """Analyze code using regex patterns for issues AST can't catch"""
         issues = []
+        if max(map(len, lines)) > self.MAX_SCAN_LINE_LENGTH:
+            # Blank out overlong lines, keeping the numbering of the rest
+            lines = [line if len(line) <= self.MAX_SCAN_LINE_LENGTH else '' for line in lines]
+            code = '\n'.join(lines)
+        # lower() can change the length of a line but never the number of lines,
+        # so line numbers are found by counting newlines in the lowered text
+        lowered_code = code.lower()
         
         for pattern_name, pattern_info in self.vulnerability_patterns.items():
-            for pattern in pattern_info['patterns']:
-                for i, line in enumerate(lines, 1):
-                    if re.search(pattern, line, re.IGNORECASE):
+            for pattern, prefilter in zip(pattern_info['compiled'], pattern_info['prefilter']):
+                # A line can only match where the whole-file prefilter matches, so
+                # jump from one prefilter hit to the next instead of trying every
+                # line; a file with no hit at all is skipped outright
+                position = index = 0
+                while True:
+                    match = prefilter.search(lowered_code, position)
+                    if not match:
+                        break
+                    index += lowered_code.count('\n', position, match.start())
+                    line = lines[index]
+                    if pattern.search(line):
                         issues.append(SecurityIssue(
                             issue_type=pattern_name,
                             severity=pattern_info['severity'],
                             description=pattern_info['description'],
-                            line_number=i,
+                            line_number=index + 1,
                             code_snippet=line.strip(),
                             recommendation=pattern_info['recommendation'],
                             cwe_id=pattern_info.get('cwe_id', ''),
                             owasp_category=pattern_info.get('owasp_category', '')
                         ))
+                    position = lowered_code.find('\n', match.start()) + 1
+                    if not position:
+                        break
+                    index += 1
         
         return issues
     
@@ -399,22 +541,16 @@ class SecurityPatternAnalyzer:
             }
         
         # Count issues by severity
-        severity_counts = {}
-        for issue in issues:
-            severity = issue.severity.value
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts = dict(Counter(issue.severity.value for issue in issues))
         
         # Calculate risk score (weighted by severity)
         risk_weights = {'low': 1, 'medium': 3, 'high': 7, 'critical': 15}
         risk_score = sum(severity_counts.get(sev, 0) * weight for sev, weight in risk_weights.items())
         
         # Group issues by type
-        issues_by_type = {}
+        issues_by_type = defaultdict(list)
         for issue in issues:
-            issue_type = issue.issue_type
-            if issue_type not in issues_by_type:
-                issues_by_type[issue_type] = []
-            issues_by_type[issue_type].append({
+            issues_by_type[issue.issue_type].append({
                 'line': issue.line_number,
                 'description': issue.description,
                 'severity': issue.severity.value,
@@ -424,24 +560,51 @@ class SecurityPatternAnalyzer:
                 'owasp_category': issue.owasp_category
             })
         
-        # Generate top recommendations
-        recommendations = list(set(issue.recommendation for issue in issues))[:5]
+        # Generate top recommendations: the first five distinct ones, most severe first
+        recommendations = list(islice(dict.fromkeys(issue.recommendation for issue in issues), 5))
         
         return {
             'filename': filename,
             'total_issues': len(issues),
             'risk_score': risk_score,
             'severity_counts': severity_counts,
-            'issues_by_type': issues_by_type,
+            'issues_by_type': dict(issues_by_type),
             'recommendations': recommendations,
             'summary': f"Found {len(issues)} security issues with risk score {risk_score}"
         }
 
 
+@lru_cache(maxsize=None)
+def get_security_analyzer() -> SecurityPatternAnalyzer:
+    """Return a shared analyzer, so the pattern tables are only built once per process"""
+    return SecurityPatternAnalyzer()
+
+
+_worker_analyzer: Optional[SecurityPatternAnalyzer] = None
+
+
+def _init_worker(analyzer: SecurityPatternAnalyzer) -> None:
+    """Install the analyzer shipped to this worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_path(path: str, analyzer: Optional[SecurityPatternAnalyzer] = None) -> List[SecurityIssue]:
+    """Read and analyze a single file; unreadable files yield no issues"""
+    if analyzer is None:
+        analyzer = cast(SecurityPatternAnalyzer, _worker_analyzer)  # Set by _init_worker
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            code = f.read()
+    except OSError:
+        return []
+    return analyzer.analyze_code_security(code, path)
+
+
 # Integration with the main Pyscription system
 def integrate_security_analysis(mentor_instance):
     """Integrate security analysis into the main Pyscription system"""
-    security_analyzer = SecurityPatternAnalyzer()
+    security_analyzer = get_security_analyzer()
     
     def analyze_code_security(code: str, filename: str = "") -> Dict[str, Any]:
         """Add security analysis capability to mentor"""
@@ -5,8 +5,18 @@ Lightweight implementation optimized for documentation search
 
 import re
 import math
-from collections import defaultdict, Counter
-from typing import Dict, List
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized IDF and array-backed sparse vectors
+    np = None
+
+# Tokenizer pattern and stop words, built once at import
+_TOKEN_PATTERN = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+_STOP_WORDS = frozenset({'the', 'is', 'at', 'which', 'on', 'and', 'or', 'but', 'in', 'with', 'a', 'an'})
 
 
 class SimpleVectorizer:
@@ -16,26 +26,37 @@ class SimpleVectorizer:
         self.vocabulary = {}
         self.idf_scores = {}
         self.doc_count = 0
+        # float32 copy of idf_scores indexed by vocabulary position, built on demand
+        self.idf_array = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the NumPy IDF cache, so a saved vectorizer loads without NumPy"""
+        state = self.__dict__.copy()
+        state['idf_array'] = None
+        return state
     
     def fit(self, documents: List[str]):
         """Fit the vectorizer on a collection of documents"""
         self.doc_count = len(documents)
         
-        # Build vocabulary and document frequency
-        doc_freq = defaultdict(int)
-        
+        # Build document frequency, counting each word once per document
+        doc_freq: Counter[str] = Counter()
         for doc in documents:
-            words = self._tokenize(doc)
-            unique_words = set(words)
-            
-            for word in unique_words:
-                doc_freq[word] += 1
-                if word not in self.vocabulary:
-                    self.vocabulary[word] = len(self.vocabulary)
+            doc_freq.update(set(self._tokenize(doc)))
+        
+        # Vocabulary indices follow first appearance in the corpus
+        for word in doc_freq:
+            if word not in self.vocabulary:
+                self.vocabulary[word] = len(self.vocabulary)
         
         # Calculate IDF scores
-        for word, freq in doc_freq.items():
-            self.idf_scores[word] = math.log(self.doc_count / freq)
+        self.idf_array = None
+        if np is not None:
+            freqs = np.fromiter(doc_freq.values(), dtype=np.float64, count=len(doc_freq))
+            self.idf_scores.update(zip(doc_freq, np.log(self.doc_count / freqs).tolist()))
+        else:
+            for word, freq in doc_freq.items():
+                self.idf_scores[word] = math.log(self.doc_count / freq)
     
     def vectorize(self, document: str) -> Dict[str, float]:
         """Convert document to TF-IDF vector"""
@@ -54,11 +75,27 @@ class SimpleVectorizer:
         
         return vector
     
+    def vectorize_sparse(self, document: str) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Convert document to a sparse TF-IDF vector of (vocabulary indices, float32 weights)"""
+        words = self._tokenize(document)
+        known = [(self.vocabulary[word], count) for word, count in Counter(words).items() if word in self.vocabulary]
+        indices = np.fromiter((index for index, _ in known), dtype=np.int32, count=len(known))
+        counts = np.fromiter((count for _, count in known), dtype=np.float32, count=len(known))
+        
+        # TF-IDF computed in float32 throughout, without per-word Python floats
+        if self.idf_array is None or len(self.idf_array) != len(self.vocabulary):
+            self.idf_array = np.zeros(len(self.vocabulary), dtype=np.float32)
+            for word, idf in self.idf_scores.items():
+                self.idf_array[self.vocabulary[word]] = idf
+        return indices, counts / np.float32(len(words)) * self.idf_array[indices]
+    
+    def to_sparse(self, vector: Dict[str, float]) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Convert a word -> weight vector into (vocabulary indices, float32 weights) arrays"""
+        indices = np.fromiter((self.vocabulary[word] for word in vector), dtype=np.int32, count=len(vector))
+        weights = np.fromiter(vector.values(), dtype=np.float32, count=len(vector))
+        return indices, weights
+    
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization"""
-        # Convert to lowercase and extract words
-        words = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', text.lower())
-        
-        # Filter out very common words
-        stop_words = {'the', 'is', 'at', 'which', 'on', 'and', 'or', 'but', 'in', 'with', 'a', 'an'}
-        return [word for word in words if word not in stop_words and len(word) > 2]
\ No newline at end of file
+        # Convert to lowercase, extract words and filter out very common ones
+        return [word for word in _TOKEN_PATTERN.findall(text.lower()) if len(word) > 2 and word not in _STOP_WORDS]
\ No newline at end of file
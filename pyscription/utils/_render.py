@@ -0,0 +1,71 @@
+"""
+Pure string helpers behind the terminal UI's rendering hot paths
+Kept free of UI state so the module can be compiled with mypyc
+"""
+
+import re
+import functools
+from typing import Callable, List, Match
+
+
+PY_KEYWORDS = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
+               'finally', 'with', 'import', 'from', 'return', 'yield', 'break', 'continue',
+               'pass', 'raise', 'assert', 'del', 'global', 'nonlocal', 'lambda', 'and', 
+               'or', 'not', 'in', 'is', 'True', 'False', 'None']
+
+# One pass over the code finds comments, strings, definitions and keywords;
+# strings and comments are matched first so keywords inside them stay plain.
+# No token spans a newline, so whole blocks can be highlighted at once
+PY_TOKEN_RE = re.compile(
+    r'(#.*)'
+    r'|("(?:[^"\\\n]|\\.)*"?|\'(?:[^\'\\\n]|\\.)*\'?)'
+    r'|\b(def|class)([ \t]+)(\w+)'
+    r'|\b(' + '|'.join(PY_KEYWORDS) + r')\b'
+)
+
+ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+SGR_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+@functools.lru_cache(maxsize=None)
+def token_colorizer(base: str, keyword: str, string: str, comment: str,
+                    function: str, class_name: str) -> Callable[[Match[str]], str]:
+    """Build the substitution callback for one highlighting palette"""
+    def colorize(match: Match[str]) -> str:
+        comment_text, string_text, definition, space, name, word = match.groups()
+        if comment_text:
+            return f"{comment}{comment_text}{base}"
+        if string_text:
+            return f"{string}{string_text}{base}"
+        if definition:
+            name_color = function if definition == 'def' else class_name
+            return f"{keyword}{definition}{base}{space}{name_color}{name}{base}"
+        return f"{keyword}{word}{base}"
+    return colorize
+
+
+@functools.lru_cache(maxsize=None)
+def merge_sgr(*codes: str) -> str:
+    """Combine adjacent SGR escapes into one, e.g. ESC[0m ESC[1m -> ESC[0;1m"""
+    params = ''.join(codes)[2:-1].replace('m\x1b[', ';')
+    return f"\x1b[{params}m" if params else ''
+
+
+@functools.lru_cache(maxsize=1024)
+def progress_bar(filled: int, width: int) -> str:
+    """Bar of filled blocks padded with empty ones; few (filled, width) pairs recur"""
+    return "█" * filled + "░" * (width - filled)
+
+
+@functools.lru_cache(maxsize=1024)
+def visible_len(text: str) -> int:
+    """Length of text as shown on screen, not counting ANSI escape sequences"""
+    if '\x1b' not in text:
+        return len(text)
+    return len(ANSI_RE.sub('', text))
+
+
+def highlight_lines(code: str, colorize: Callable[[Match[str]], str], base: str, reset: str) -> List[str]:
+    """Highlight code in a single regex pass and split it into colored lines"""
+    lines = PY_TOKEN_RE.sub(colorize, code).split('\n')
+    return [f"{base}{line}{reset}" if line.strip() else line for line in lines]
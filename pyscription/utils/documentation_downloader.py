@@ -4,15 +4,19 @@ Supports automatic download and extraction of official Python docs
 """
 
 import os
+import itertools
 import urllib.request
 import tarfile
 import tempfile
 from pathlib import Path
+from typing import Optional
 
 
 class DocumentationDownloader:
     """Helper class to download Python documentation with local docs detection"""
     
+    CHUNK_SIZE = 1 << 20  # 1 MiB per read while downloading
+    
     @staticmethod
     def find_local_docs() -> str:
         """Find local Python documentation in common locations"""
@@ -33,8 +37,9 @@ class DocumentationDownloader:
         
         for location in possible_locations:
             if location.exists() and location.is_dir():
-                # Check if it contains documentation files
-                txt_files = list(location.rglob('*.txt'))
+                # Check if it contains documentation files, stopping the walk
+                # as soon as there are enough of them
+                txt_files = list(itertools.islice(location.rglob('*.txt'), 11))
                 if len(txt_files) > 10:  # Reasonable threshold for Python docs
                     print(f"📚 Found local Python documentation at: {location}")
                     return str(location)
@@ -42,7 +47,7 @@ class DocumentationDownloader:
         return ""
     
     @staticmethod
-    def download_python_docs(version: str = "3.11", target_dir: str = None) -> str:
+    def download_python_docs(version: str = "3.11", target_dir: Optional[str] = None) -> str:
         """Download Python documentation, checking for local docs first"""
         # First, check for local documentation
         local_docs = DocumentationDownloader.find_local_docs()
@@ -51,13 +56,13 @@ class DocumentationDownloader:
             return local_docs
         
         if target_dir is None:
-            target_dir = Path.home() / '.pyscription' / 'python_docs'
-        
-        target_dir = Path(target_dir)
-        target_dir.mkdir(parents=True, exist_ok=True)
+            docs_dir = Path.home() / '.pyscription' / 'python_docs'
+        else:
+            docs_dir = Path(target_dir)
+        docs_dir.mkdir(parents=True, exist_ok=True)
         
         print(f"📥 No local docs found, downloading Python {version} documentation...")
-        print(f"Target directory: {target_dir}")
+        print(f"Target directory: {docs_dir}")
         
         # URLs for Python documentation
         doc_urls = {
@@ -73,23 +78,54 @@ class DocumentationDownloader:
         try:
             url = doc_urls[version]
             
-            # Download to temporary file
+            # Download to temporary file in fixed-size chunks
             with tempfile.NamedTemporaryFile(suffix='.tar.bz2', delete=False) as tmp_file:
                 print("⬇️  Downloading...")
-                urllib.request.urlretrieve(url, tmp_file.name)
-                
+                with urllib.request.urlopen(url) as response:
+                    total = int(response.headers.get('Content-Length') or 0)
+                    downloaded = 0
+                    while True:
+                        chunk = response.read(DocumentationDownloader.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        tmp_file.write(chunk)
+                        downloaded += len(chunk)
+                        if total:
+                            print(f"\r⬇️  Downloading... {downloaded * 100 // total}%", end='', flush=True)
+                if total:
+                    print()
+            
+            try:
                 # Extract
                 print("📦 Extracting...")
                 with tarfile.open(tmp_file.name, 'r:bz2') as tar:
-                    tar.extractall(target_dir)
-                
+                    DocumentationDownloader._safe_extract(tar, docs_dir)
+            finally:
                 # Clean up
                 os.unlink(tmp_file.name)
             
-            print(f"✅ Python {version} documentation downloaded to {target_dir}")
-            return str(target_dir)
+            print(f"✅ Python {version} documentation downloaded to {docs_dir}")
+            return str(docs_dir)
             
         except Exception as e:
             print(f"❌ Error downloading documentation: {e}")
             print("💡 Try manually downloading from https://docs.python.org/")
-            return ""
\ No newline at end of file
+            return ""
+    
+    @staticmethod
+    def _safe_extract(tar: tarfile.TarFile, target_dir: Path) -> None:
+        """Extract files and directories one member at a time, skipping any that escape target_dir"""
+        root = target_dir.resolve()
+        # Python versions with extraction filters also reject unsafe permissions and links
+        use_data_filter = hasattr(tarfile, 'data_filter')
+        for member in tar:
+            if not (member.isfile() or member.isdir()):
+                continue  # Links and special files are never needed for the docs
+            destination = (root / member.name).resolve()
+            if destination != root and root not in destination.parents:
+                print(f"⚠️  Skipping unsafe archive member: {member.name}")
+                continue
+            if use_data_filter:
+                tar.extract(member, root, filter='data')
+            else:
+                tar.extract(member, root)
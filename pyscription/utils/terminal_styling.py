@@ -4,94 +4,288 @@ Beautiful syntax highlighting and UI elements
 """
 
 import os
+import atexit
 import sys
-import time
-from typing import Optional
+import signal
+import shutil
+import threading
+import functools
+from typing import List
+
+from pyscription.utils._render import (ANSI_RE as _ANSI_RE, SGR_RE as _SGR_RE,
+                                       highlight_lines as _highlight_lines, merge_sgr,
+                                       progress_bar as _progress_bar,
+                                       token_colorizer as _token_colorizer, visible_len)
+
+
+# ANSI color codes for terminal styling - Calm color palette
+# They are module globals so renderers reach them with a global lookup rather
+# than a class attribute lookup. Codes are only str: TerminalUI joins a call's
+# output and writes it as one str, so nothing is ever encoded per reference
+
+# Reset
+RESET = '\033[0m'
+BOLD = '\033[1m'
+DIM = '\033[2m'
+ITALIC = '\033[3m'
+UNDERLINE = '\033[4m'
+BLINK = '\033[5m'
+
+# Background colors - Calm and subtle
+BG_CONTAINER = '\033[48;5;236m'     # Dark gray container background
+BG_CONTENT = '\033[48;5;234m'       # Slightly darker content area
+BG_HEADER = '\033[48;5;238m'        # Header background
+BG_INPUT = '\033[48;5;235m'         # Input area background
+BG_SUCCESS = '\033[48;5;22m'        # Muted green
+BG_ERROR = '\033[48;5;52m'          # Muted red
+BG_WARNING = '\033[48;5;58m'        # Muted yellow/brown
+BG_INFO = '\033[48;5;24m'           # Muted blue
+
+# Foreground colors - Calm and readable
+BLACK = '\033[38;5;16m'             # Pure black
+WHITE = '\033[38;5;231m'            # Pure white
+LIGHT_GRAY = '\033[38;5;250m'       # Light gray for main text
+GRAY = '\033[38;5;244m'             # Medium gray for secondary text
+DARK_GRAY = '\033[38;5;240m'        # Dark gray for dimmed text
+
+# Calm accent colors
+SOFT_BLUE = '\033[38;5;74m'         # Soft blue for keywords
+SOFT_CYAN = '\033[38;5;80m'         # Soft cyan for functions
+SOFT_GREEN = '\033[38;5;72m'        # Soft green for strings
+SOFT_ORANGE = '\033[38;5;179m'      # Soft orange for numbers
+SOFT_PURPLE = '\033[38;5;140m'      # Soft purple for types
+SOFT_RED = '\033[38;5;167m'         # Soft red for errors
+SOFT_YELLOW = '\033[38;5;186m'      # Soft yellow for warnings
+
+# Container border colors
+BORDER_LIGHT = '\033[38;5;245m'     # Light border
+BORDER_DARK = '\033[38;5;239m'      # Dark border
+
+# Gradient colors for fancy effects
+GRADIENT_BLUE = [
+    '\033[38;5;18m',   # Dark blue
+    '\033[38;5;19m',   # 
+    '\033[38;5;20m',   # 
+    '\033[38;5;21m',   # 
+    '\033[38;5;39m',   # Bright blue
+    '\033[38;5;51m',   # Cyan
+]
+
+# Aliases used by the dashboards, task lists and code blocks
+BG_GREEN = BG_SUCCESS
+BG_RED = BG_ERROR
+BG_YELLOW = BG_WARNING
+BG_LIGHT_BLUE = BG_INFO
+BG_DARK_BLUE = BG_HEADER
+BG_GRAY = BG_CONTAINER
+BG_WHITE = '\033[48;5;254m'        # Light background behind black code text
+GREEN = SOFT_GREEN
+RED = SOFT_RED
+ORANGE = SOFT_ORANGE
+BLUE = SOFT_BLUE
+DARK_BLUE = SOFT_BLUE
+LIGHT_BLUE = SOFT_CYAN
+BRIGHT_BLUE = SOFT_CYAN
+CYAN = SOFT_CYAN
+PURPLE = SOFT_PURPLE
 
 
 class Colors:
     """ANSI color codes for terminal styling - Calm color palette"""
-    
-    # Reset
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    ITALIC = '\033[3m'
-    UNDERLINE = '\033[4m'
-    
-    # Background colors - Calm and subtle
-    BG_CONTAINER = '\033[48;5;236m'     # Dark gray container background
-    BG_CONTENT = '\033[48;5;234m'       # Slightly darker content area
-    BG_HEADER = '\033[48;5;238m'        # Header background
-    BG_INPUT = '\033[48;5;235m'         # Input area background
-    BG_SUCCESS = '\033[48;5;22m'        # Muted green
-    BG_ERROR = '\033[48;5;52m'          # Muted red
-    BG_WARNING = '\033[48;5;58m'        # Muted yellow/brown
-    BG_INFO = '\033[48;5;24m'           # Muted blue
-    
-    # Foreground colors - Calm and readable
-    BLACK = '\033[38;5;16m'             # Pure black
-    WHITE = '\033[38;5;231m'            # Pure white
-    LIGHT_GRAY = '\033[38;5;250m'       # Light gray for main text
-    GRAY = '\033[38;5;244m'             # Medium gray for secondary text
-    DARK_GRAY = '\033[38;5;240m'        # Dark gray for dimmed text
-    
-    # Calm accent colors
-    SOFT_BLUE = '\033[38;5;74m'         # Soft blue for keywords
-    SOFT_CYAN = '\033[38;5;80m'         # Soft cyan for functions
-    SOFT_GREEN = '\033[38;5;72m'        # Soft green for strings
-    SOFT_ORANGE = '\033[38;5;179m'      # Soft orange for numbers
-    SOFT_PURPLE = '\033[38;5;140m'      # Soft purple for types
-    SOFT_RED = '\033[38;5;167m'         # Soft red for errors
-    SOFT_YELLOW = '\033[38;5;186m'      # Soft yellow for warnings
-    
-    # Container border colors
-    BORDER_LIGHT = '\033[38;5;245m'     # Light border
-    BORDER_DARK = '\033[38;5;239m'      # Dark border
-    
-    # Gradient colors for fancy effects
-    GRADIENT_BLUE = [
-        '\033[38;5;18m',   # Dark blue
-        '\033[38;5;19m',   # 
-        '\033[38;5;20m',   # 
-        '\033[38;5;21m',   # 
-        '\033[38;5;39m',   # Bright blue
-        '\033[38;5;51m',   # Cyan
-    ]
+
+
+# Colors stays the public namespace for code outside this module
+for _name in [name for name in dir() if name.isupper() and not name.startswith('_')]:
+    setattr(Colors, _name, globals()[_name])
+del _name
+
+
+def _buffered(method):
+    """Collect a UI method's output and write it once the outermost call returns"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._flush()
+    return wrapper
 
 
 class TerminalUI:
     """Modern terminal UI components"""
     
+    # Fixed fragments of a container row; only the text between them varies.
+    # Back-to-back color codes are merged into one escape sequence
+    _BORDER = f"{BORDER_LIGHT}│"
+    _ROW_START = f"{BORDER_LIGHT}│ "
+    _ROW_END = f"{BORDER_LIGHT}│{RESET}\n"
+    _FILLED_ROW_END = f"{merge_sgr(RESET, BORDER_LIGHT)} │{RESET}\n"
+    
+    # Clear the screen and move the cursor to the top-left corner
+    _CLEAR_SCREEN = '\033[2J\033[H'
+    
+    # Markers for each task state and priority
+    TASK_STATUS_EMOJI = {'completed': "✅", 'in_progress': "🚀", 'pending': "⏳", 'failed': "❌"}
+    TASK_PRIORITY_EMOJI = {'high': "🔥", 'medium': "⚡"}
+    
+    # Label and status key of each counter on the agent status dashboard
+    _AGENT_STATS = (
+        ("📋 Total Tasks", 'total_tasks'),
+        ("⏳ Pending", 'pending'),
+        ("🚀 In Progress", 'in_progress'),
+        ("✅ Completed", 'completed'),
+        ("❌ Failed", 'failed'),
+    )
+    
+    # Seconds between redraws of a live progress or thinking line
+    ANIMATION_INTERVAL = 0.1
+    
     def __init__(self):
+        # Output is queued here and written in one go per UI call, instead of
+        # one write per line
+        self._buffer = []
+        self._depth = 0
+        # Count of flushed writes, so a redraw can tell whether anything was
+        # printed over the previous frame
+        self._writes = 0
+        self._last_dashboard = None
+        self._last_header = (None, "")
+        # Live progress/thinking lines are redrawn by a background thread;
+        # callers only replace the state it renders from. The lock guards that
+        # state and serializes every write to stdout, so frames never land in
+        # the middle of other output
+        self._live = None
+        self._output_lock = threading.Lock()
+        self._frame = 0  # Animation ticks so far; spinners derive their glyph from it
+        self._live_stop = threading.Event()
+        self._live_thread = None
+        # The terminal size is queried once and then only again after a
+        # resize, on first use, instead of an ioctl on every redraw
+        self._size = self._read_terminal_size()
         self.width = self._get_terminal_width()
+        self._watching_resize = False
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                signal.signal(signal.SIGWINCH, self._on_resize)
+                self._watching_resize = True
+            except ValueError:
+                pass  # Not the main thread, so no resize notifications
+        # When piped into a file or another program nobody renders escape
+        # sequences, so output is written as plain text. On a terminal,
+        # NO_COLOR (https://no-color.org) drops colors but keeps cursor control
+        self._tty = sys.stdout.isatty()
+        if not self._tty:
+            self._strip = _ANSI_RE
+        elif os.environ.get('NO_COLOR'):
+            self._strip = _SGR_RE
+        else:
+            self._strip = None
         self.setup_terminal()
+        atexit.register(self._show_cursor)
+    
+    def _show_cursor(self):
+        """Make the cursor visible again when the program exits"""
+        if not self._tty:
+            return
+        try:
+            with self._output_lock:
+                sys.stdout.write('\033[?25h')
+                sys.stdout.flush()
+        except (OSError, ValueError):
+            pass  # stdout already closed
+    
+    def _content_row(self, color: str, text: str, width: int, background: str = BG_CONTENT):
+        """Queue a filled container row with the text padded to width"""
+        self._emit(''.join((self._ROW_START, merge_sgr(background, color), text,
+                            ' ' * (width - visible_len(text)), self._FILLED_ROW_END)))
+    
+    def _message_row(self, color: str, text: str, width: int, lead: str = ' '):
+        """Queue an unfilled container row with the text padded to width"""
+        self._emit(''.join((self._BORDER, lead, color, text, RESET,
+                            ' ' * (width - visible_len(text)), self._ROW_END)))
+    
+    def _emit(self, text: str):
+        """Queue text for the next flush"""
+        self._buffer.append(text)
+    
+    def _flush(self):
+        """Write all queued output with a single write"""
+        if self._buffer:
+            # Any other output ends the live line first, on its last state
+            if self._live is not None:
+                self.stop_progress()
+            # Writing encoded frames straight to the fd with os.write() was
+            # measured slower on a pty: TextIOWrapper's write is C code, while
+            # the extra flush, encode and write loop run as Python
+            text = ''.join(self._buffer)
+            if self._strip is not None:
+                text = self._strip.sub('', text)
+            self._buffer.clear()
+            self._writes += 1
+            with self._output_lock:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+        else:
+            sys.stdout.flush()
     
+    @_buffered
     def setup_terminal(self):
         """Setup terminal for containerized display"""
-        # Clear screen
-        print('\033[2J', end='')  # Clear screen
-        print('\033[H', end='')   # Move cursor to top
+        # Clear screen and hide cursor; input_prompt shows it while reading
+        self._emit(self._CLEAR_SCREEN + '\033[?25l')
         
         # Initialize container UI
         self.print_container_frame()
     
+    @property
+    def width(self) -> int:
+        """Usable terminal width; border lines are rebuilt whenever it changes"""
+        if self._size is None:
+            self.update_terminal_size()
+        return self._width
+    
+    @width.setter
+    def width(self, width: int):
+        if width == getattr(self, '_width', None):
+            return
+        self._width = width
+        self._hline = '─' * (width - 2)
+        self._rule = '─' * width
+        self._double_rule = '═' * width
+        self._top_border = f"{BORDER_LIGHT}┌{self._hline}┐{RESET}\n"
+        self._bottom_border = f"{BORDER_LIGHT}└{self._hline}┘{RESET}\n"
+        self._divider = f"{BORDER_LIGHT}├{self._hline}┤{RESET}\n"
+        self._header_divider = f"{BORDER_LIGHT}├{'─' * (width - 4)}┤{RESET}\n"
+        self._blank_row = f"{BORDER_LIGHT}│{' ' * (width - 2)}│{RESET}\n"
+    
+    def _read_terminal_size(self) -> os.terminal_size:
+        """Query the terminal size, honouring COLUMNS/LINES and defaulting to 80x24"""
+        return shutil.get_terminal_size((80, 24))
+    
+    def _on_resize(self, signum, frame):
+        """Drop the cached terminal size after a SIGWINCH"""
+        # Only invalidate: a burst of signals while a window is dragged costs
+        # one ioctl at the next read, and no frame is resized halfway through
+        self._size = None
+    
     def _get_terminal_width(self) -> int:
         """Get terminal width with responsive design"""
-        try:
-            width = os.get_terminal_size().columns
-            # Responsive width constraints
-            if width < 60:
-                return 60  # Minimum readable width
-            elif width > 120:
-                return 120  # Maximum for readability
-            else:
-                return width
-        except:
-            return 80  # Safe default
+        # Responsive width constraints: 60 minimum readable, 120 maximum for readability
+        return max(60, min(120, self._size.columns))
     
+    @_buffered
     def print_header(self, title: str, subtitle: str = ""):
         """Print a calm containerized header"""
+        # Redraws usually repeat the last header, so its output is reused
+        key = (title, subtitle, self.width)
+        if self._last_header[0] == key:
+            self._emit(self._last_header[1])
+            return
+        start = len(self._buffer)
+        
         self.clear_screen()
         self.print_container_frame()
         
@@ -99,566 +293,504 @@ class TerminalUI:
         container_width = self.width - 4
         
         # Header section
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_HEADER}{Colors.WHITE}" + 
-              f" 💊 {title}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        self._content_row(WHITE, f" 💊 {title}", container_width, BG_HEADER)
         
         if subtitle:
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.GRAY}" + 
-                  f" {subtitle}".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            self._content_row(GRAY, f" {subtitle}", container_width)
         
         # Separator
-        print(f"{Colors.BORDER_LIGHT}├{'─' * container_width}┤{Colors.RESET}")
-        print()
+        self._emit(self._header_divider)
+        self._emit("\n")
+        self._last_header = (key, ''.join(self._buffer[start:]))
     
+    @_buffered
     def print_section(self, title: str, emoji: str = "📋"):
         """Print a calm section header within container"""
         container_width = self.width - 4
         section_line = f" {emoji} {title}"
         
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.SOFT_BLUE}" + 
-              f"{section_line}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        self._content_row(SOFT_BLUE, section_line, container_width)
         
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.DARK_GRAY}" + 
-              f"{'─' * (len(section_line) - 1)}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        self._content_row(DARK_GRAY, f"{'─' * (len(section_line) - 1)}", container_width)
     
+    @_buffered
     def print_command_help(self, commands: list):
         """Print command help in containerized format"""
         self.print_section("Available Commands", "⚡")
         
         container_width = self.width - 4
         for cmd, desc in commands:
-            cmd_line = f"  {cmd:<20} - {desc}"
+            cmd_line = f"{cmd:<20} - {desc}"
             if len(cmd_line) > container_width:
-                cmd_line = cmd_line[:container_width-3] + "..."
+                desc = desc[:container_width - len(cmd_line) + len(desc) - 3] + "..."
             
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.SOFT_CYAN}" + 
-                  f"{cmd:<20}{Colors.LIGHT_GRAY} - {desc}".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            self._content_row(SOFT_CYAN, f"{cmd:<20}{LIGHT_GRAY} - {desc}", container_width)
         
         self.print_container_separator()
     
+    @_buffered
     def print_status_box(self, title: str, items: list, status_type: str = "info"):
         """Print a status box with colored indicators"""
         # Choose colors based on status type
         if status_type == "success":
-            bg_color = Colors.BG_GREEN
-            text_color = Colors.BLACK
+            bg_color = BG_GREEN
+            text_color = BLACK
             border_char = "✅"
         elif status_type == "error":
-            bg_color = Colors.BG_RED
-            text_color = Colors.WHITE
+            bg_color = BG_RED
+            text_color = WHITE
             border_char = "❌"
         elif status_type == "warning":
-            bg_color = Colors.BG_YELLOW
-            text_color = Colors.BLACK
+            bg_color = BG_YELLOW
+            text_color = BLACK
             border_char = "⚠️"
         else:
-            bg_color = Colors.BG_LIGHT_BLUE
-            text_color = Colors.DARK_BLUE
+            bg_color = BG_LIGHT_BLUE
+            text_color = DARK_BLUE
             border_char = "ℹ️"
         
         # Header
-        print(f"{bg_color}{text_color} {border_char} {Colors.BOLD}{title} {Colors.RESET}")
+        self._emit(f"{bg_color}{text_color} {border_char} {BOLD}{title} {RESET}\n")
         
         # Items
         for item in items:
-            print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}  • {item}{Colors.RESET}")
-        print()
+            self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}  • {item}{RESET}\n")
+        self._emit("\n")
     
+    @_buffered
     def print_progress_bar(self, progress: float, title: str = "", width: int = 40):
         """Print a beautiful progress bar"""
-        filled = int(progress * width)
-        bar = "█" * filled + "░" * (width - filled)
+        self._emit(self._progress_bar_line(progress, title, width))
+    
+    def _progress_bar_line(self, progress: float, title: str, width: int) -> str:
+        """Render a progress bar as a single output line"""
+        bar = _progress_bar(int(progress * width), width)
         percentage = f"{progress:.0%}"
         
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}{title} " +
-              f"{Colors.GREEN}[{bar}]{Colors.RESET} " +
-              f"{Colors.BG_LIGHT_BLUE}{Colors.BRIGHT_BLUE}{percentage}{Colors.RESET}")
+        return (f"{BG_LIGHT_BLUE}{DARK_BLUE}{title} " +
+                f"{GREEN}[{bar}]{RESET} " +
+                f"{BG_LIGHT_BLUE}{BRIGHT_BLUE}{percentage}{RESET}\n")
     
     def print_live_progress(self, progress: float, title: str, details: str = "", show_spinner: bool = True):
-        """Print live updating progress with spinner animation"""
+        """Print live updating progress with spinner animation until stop_progress() or other UI output"""
+        self._update_live_line(self._live_progress_line, progress, title, details, show_spinner)
+    
+    def _live_progress_line(self, progress: float, title: str, details: str, show_spinner: bool) -> str:
+        """Render one frame of the live progress line"""
         spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        spinner = spinner_chars[int(time.time() * 4) % len(spinner_chars)] if show_spinner else "🚀"
+        spinner = spinner_chars[self._frame // 2 % len(spinner_chars)] if show_spinner else "🚀"
         
-        filled = int(progress * 30)
-        bar = "█" * filled + "░" * (30 - filled)
+        bar = _progress_bar(int(progress * 30), 30)
         percentage = f"{progress:.0%}"
         
         # Clear line and print progress
-        print(f"\r{Colors.BG_LIGHT_BLUE}{Colors.BRIGHT_BLUE} {spinner} {title} " +
-              f"{Colors.GREEN}[{bar}] {percentage}{Colors.RESET} " +
-              f"{Colors.BG_LIGHT_BLUE}{Colors.GRAY}{details}{Colors.RESET}", end="", flush=True)
+        return (f"\r{BG_LIGHT_BLUE}{BRIGHT_BLUE} {spinner} {title} " +
+                f"{GREEN}[{bar}] {percentage}{RESET} " +
+                f"{BG_LIGHT_BLUE}{GRAY}{details}{RESET}")
     
+    @_buffered
     def print_task_progress_dashboard(self, tasks_status: dict, current_task: str = ""):
         """Print a real-time task progress dashboard"""
-        import time
+        spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        # Each render is one animation tick, unless a live line is ticking
+        if self._live_thread is None:
+            self._frame += 1
+        spinner = spinner_chars[self._frame % len(spinner_chars)] if current_task else ""
+        
+        # Skip the redraw if this exact frame is still on screen. The dashboard
+        # is a full-screen view redrawn in a loop, so the UI owns the screen here.
+        # A spinner moves on every render, so frames with one are always drawn
+        state = (tuple(sorted(tasks_status.items())), current_task, self.width)
+        if not current_task and self._last_dashboard == (state, self._writes):
+            return
         
         self.clear_screen()
         
         # Header
-        print(f"{Colors.BG_DARK_BLUE}{Colors.WHITE} 🤖 REAL-TIME AGENT PROGRESS {Colors.RESET}")
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}{'═' * self.width}{Colors.RESET}")
+        self._emit(f"{BG_DARK_BLUE}{WHITE} 🤖 REAL-TIME AGENT PROGRESS {RESET}\n")
+        self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}{self._double_rule}{RESET}\n")
         
         # Current task with animation
         if current_task:
-            spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            spinner = spinner_chars[int(time.time() * 4) % len(spinner_chars)]
-            print(f"{Colors.BG_LIGHT_BLUE}{Colors.BRIGHT_BLUE} {spinner} Current: {Colors.BOLD}{current_task}{Colors.RESET}")
+            self._emit(f"{BG_LIGHT_BLUE}{BRIGHT_BLUE} {spinner} Current: {BOLD}{current_task}{RESET}\n")
         
         # Progress bars for each status
         total_tasks = sum(tasks_status.values())
         if total_tasks > 0:
             for status, count in tasks_status.items():
                 progress = count / total_tasks
-                status_emoji = {"completed": "✅", "in_progress": "🚀", "pending": "⏳", "failed": "❌"}
-                emoji = status_emoji.get(status, "📋")
+                emoji = self.TASK_STATUS_EMOJI.get(status, "📋")
                 
                 self.print_progress_bar(progress, f"  {emoji} {status.title()}:", width=50)
         
         # Overall completion
         completed = tasks_status.get('completed', 0)
         overall_progress = completed / total_tasks if total_tasks > 0 else 0
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}{'─' * self.width}{Colors.RESET}")
+        self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}{self._rule}{RESET}\n")
         self.print_progress_bar(overall_progress, "  🎯 Overall Progress:", width=60)
         
-        print(f"\n{Colors.BG_LIGHT_BLUE}{Colors.GRAY}Press Ctrl+C to stop agent execution{Colors.RESET}")
+        self._emit(f"\n{BG_LIGHT_BLUE}{GRAY}Press Ctrl+C to stop agent execution{RESET}\n")
+        self._flush()
+        self._last_dashboard = (state, self._writes)
     
     def animate_thinking(self, message: str = "Agent thinking"):
-        """Show animated thinking indicator"""
-        import time
-        
-        thinking_chars = ["🤔", "💭", "🧠", "⚡", "✨", "🔍"]
-        char = thinking_chars[int(time.time() * 2) % len(thinking_chars)]
-        
-        print(f"\r{Colors.BG_LIGHT_BLUE}{Colors.PURPLE} {char} {message}... {Colors.RESET}", end="", flush=True)
+        """Show animated thinking indicator until stop_progress() or other UI output"""
+        self._update_live_line(self._thinking_line, message)
     
+    def _thinking_line(self, message: str) -> str:
+        """Render one frame of the thinking indicator"""
+        thinking_chars = ["🤔", "💭", "🧠", "⚡", "✨", "🔍"]
+        char = thinking_chars[self._frame // 5 % len(thinking_chars)]
+        
+        return f"\r{BG_LIGHT_BLUE}{PURPLE} {char} {message}... {RESET}"
+    
+    def _update_live_line(self, render, *args):
+        """Publish new live-line state, starting the animation thread if needed"""
+        with self._output_lock:
+            self._live = (render, args)
+            if not self._tty:
+                return  # Only the final state is written, by stop_progress()
+            if self._live_thread is not None and self._live_thread.is_alive():
+                return
+            # The first frame is drawn right away, so errors reach the caller
+            line = self._live_frame()
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            self._live_stop.clear()
+            self._live_thread = threading.Thread(target=self._animate, args=(line,), daemon=True)
+            self._live_thread.start()
+    
+    def _animate(self, shown: str):
+        """Redraw the live line at a fixed rate until stop_progress()"""
+        while not self._live_stop.wait(self.ANIMATION_INTERVAL):
+            with self._output_lock:
+                self._frame += 1
+                line = self._live_frame()
+                if line == shown:
+                    continue  # Spinner and state unchanged; the terminal already shows it
+                sys.stdout.write(line)
+                sys.stdout.flush()
+                shown = line
+    
+    def _live_frame(self) -> str:
+        """Render the current live-line state, minus any escapes being dropped"""
+        render, args = self._live
+        line = render(*args)
+        return self._strip.sub('', line) if self._strip is not None else line
+    
+    def stop_progress(self):
+        """Stop the live line animation, leaving its last state on screen"""
+        with self._output_lock:
+            thread, self._live_thread = self._live_thread, None
+        if thread is not None:
+            self._live_stop.set()
+            thread.join()
+        elif self._tty or self._live is None:
+            return
+        with self._output_lock:
+            line = self._live_frame()
+            self._live = None
+            if not self._tty:
+                line = line.lstrip('\r')
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+    
+    @_buffered
     def print_code_block(self, code: str, language: str = "python"):
         """Print syntax-highlighted code block"""
-        print(f"{Colors.BG_GRAY}{Colors.WHITE} {language.upper()} {Colors.RESET}")
-        print(f"{Colors.BG_WHITE}{Colors.BLACK}┌{'─' * (self.width - 2)}┐{Colors.RESET}")
+        self._emit(f"{BG_GRAY}{WHITE} {language.upper()} {RESET}\n")
+        self._emit(f"{BG_WHITE}{BLACK}┌{self._hline}┐{RESET}\n")
         
-        lines = code.split('\n')
-        for i, line in enumerate(lines, 1):
+        line_start = merge_sgr(BG_WHITE, GRAY)
+        for i, highlighted_line in enumerate(self._highlight_python_syntax(code), 1):
             line_num = f"{i:3d}"
-            highlighted_line = self._highlight_python_syntax(line)
-            print(f"{Colors.BG_WHITE}{Colors.GRAY}│{line_num}│{highlighted_line:<{self.width-6}}│{Colors.RESET}")
+            padding = ' ' * (self.width - 6 - visible_len(highlighted_line))
+            self._emit(f"{line_start}│{line_num}│{highlighted_line}{padding}│{RESET}\n")
         
-        print(f"{Colors.BG_WHITE}{Colors.BLACK}└{'─' * (self.width - 2)}┘{Colors.RESET}")
-        print()
+        self._emit(f"{BG_WHITE}{BLACK}└{self._hline}┘{RESET}\n")
+        self._emit("\n")
     
+    @_buffered
     def print_code_block_container(self, code: str, language: str = "python"):
         """Print syntax-highlighted code block within container"""
         container_width = self.width - 4
         
         # Code header
         header = f" {language.upper()} "
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_HEADER}{Colors.WHITE}" + 
-              f"{header}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        self._content_row(WHITE, header, container_width, BG_HEADER)
+        
+        # Truncate long lines before highlighting, so that no escape sequence
+        # gets cut in half; the line number column takes 5 characters
+        limit = container_width - 9
+        lines = [line if len(line) <= limit else line[:limit-3] + "..." for line in code.split('\n')]
         
         # Code content with line numbers
-        lines = code.split('\n')
-        for i, line in enumerate(lines, 1):
-            line_num = f"{i:3d}"
-            highlighted_line = self._highlight_python_syntax_container(line)
-            code_line = f"{line_num}│ {highlighted_line}"
-            
-            # Truncate if too long
-            if len(code_line) > container_width - 4:
-                code_line = code_line[:container_width-7] + "..."
-            
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.DARK_GRAY}" + 
-                  f"{code_line}".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        for i, highlighted_line in enumerate(self._highlight_python_syntax_container('\n'.join(lines)), 1):
+            self._content_row(DARK_GRAY, f"{i:3d}│ {highlighted_line}", container_width)
         
         self.print_container_separator()
     
-    def _highlight_python_syntax(self, line: str) -> str:
-        """Apply syntax highlighting to Python code"""
-        if not line.strip():
-            return line
-        
-        # Keywords
-        keywords = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
-                   'finally', 'with', 'import', 'from', 'return', 'yield', 'break', 'continue',
-                   'pass', 'raise', 'assert', 'del', 'global', 'nonlocal', 'lambda', 'and', 
-                   'or', 'not', 'in', 'is', 'True', 'False', 'None']
-        
-        highlighted = line
-        
-        # Highlight keywords
-        for keyword in keywords:
-            highlighted = highlighted.replace(f' {keyword} ', f' {Colors.BRIGHT_BLUE}{keyword}{Colors.BLACK} ')
-            if highlighted.startswith(f'{keyword} '):
-                highlighted = f'{Colors.BRIGHT_BLUE}{keyword}{Colors.BLACK}' + highlighted[len(keyword):]
-        
-        # Highlight strings
-        highlighted = highlighted.replace('"', f'{Colors.GREEN}"{Colors.BLACK}')
-        highlighted = highlighted.replace("'", f'{Colors.GREEN}\'{Colors.BLACK}')
-        
-        # Highlight comments
-        if '#' in highlighted:
-            comment_start = highlighted.find('#')
-            if comment_start != -1:
-                highlighted = (highlighted[:comment_start] + 
-                             f'{Colors.GRAY}{highlighted[comment_start:]}{Colors.BLACK}')
-        
-        # Highlight function names (simple pattern)
-        import re
-        highlighted = re.sub(r'\bdef\s+(\w+)', f'{Colors.BRIGHT_BLUE}def{Colors.BLACK} {Colors.CYAN}\\1{Colors.BLACK}', highlighted)
-        highlighted = re.sub(r'\bclass\s+(\w+)', f'{Colors.BRIGHT_BLUE}class{Colors.BLACK} {Colors.PURPLE}\\1{Colors.BLACK}', highlighted)
-        
-        return f"{Colors.BLACK}{highlighted}{Colors.RESET}"
-    
-    def _highlight_python_syntax_container(self, line: str) -> str:
-        """Apply calm syntax highlighting for containerized code"""
-        if not line.strip():
-            return line
-        
-        # Keywords
-        keywords = ['def', 'class', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
-                   'finally', 'with', 'import', 'from', 'return', 'yield', 'break', 'continue',
-                   'pass', 'raise', 'assert', 'del', 'global', 'nonlocal', 'lambda', 'and', 
-                   'or', 'not', 'in', 'is', 'True', 'False', 'None']
-        
-        highlighted = line
-        
-        # Highlight keywords with soft colors
-        for keyword in keywords:
-            highlighted = highlighted.replace(f' {keyword} ', f' {Colors.SOFT_BLUE}{keyword}{Colors.LIGHT_GRAY} ')
-            if highlighted.startswith(f'{keyword} '):
-                highlighted = f'{Colors.SOFT_BLUE}{keyword}{Colors.LIGHT_GRAY}' + highlighted[len(keyword):]
-        
-        # Highlight strings with soft green
-        highlighted = highlighted.replace('"', f'{Colors.SOFT_GREEN}"{Colors.LIGHT_GRAY}')
-        highlighted = highlighted.replace("'", f'{Colors.SOFT_GREEN}\'{Colors.LIGHT_GRAY}')
-        
-        # Highlight comments with soft gray
-        if '#' in highlighted:
-            comment_start = highlighted.find('#')
-            if comment_start != -1:
-                highlighted = (highlighted[:comment_start] + 
-                             f'{Colors.DARK_GRAY}{highlighted[comment_start:]}{Colors.LIGHT_GRAY}')
-        
-        # Highlight function and class names
-        import re
-        highlighted = re.sub(r'\bdef\s+(\w+)', f'{Colors.SOFT_BLUE}def{Colors.LIGHT_GRAY} {Colors.SOFT_CYAN}\\1{Colors.LIGHT_GRAY}', highlighted)
-        highlighted = re.sub(r'\bclass\s+(\w+)', f'{Colors.SOFT_BLUE}class{Colors.LIGHT_GRAY} {Colors.SOFT_PURPLE}\\1{Colors.LIGHT_GRAY}', highlighted)
-        
-        return f"{Colors.LIGHT_GRAY}{highlighted}{Colors.RESET}"
+    def _highlight_python_syntax(self, code: str) -> List[str]:
+        """Apply syntax highlighting to Python code, one string per line"""
+        colorize = _token_colorizer(BLACK, BRIGHT_BLUE, GREEN,
+                                    GRAY, CYAN, PURPLE)
+        return _highlight_lines(code, colorize, BLACK, RESET)
+    
+    def _highlight_python_syntax_container(self, code: str) -> List[str]:
+        """Apply calm syntax highlighting for containerized code, one string per line"""
+        colorize = _token_colorizer(LIGHT_GRAY, SOFT_BLUE, SOFT_GREEN,
+                                    DARK_GRAY, SOFT_CYAN, SOFT_PURPLE)
+        return _highlight_lines(code, colorize, LIGHT_GRAY, RESET)
     
+    @_buffered
     def print_task_list(self, tasks: list, show_details: bool = False):
         """Print a beautiful task list"""
         if not tasks:
-            print(f"{Colors.BG_LIGHT_BLUE}{Colors.GRAY}  No tasks available{Colors.RESET}")
+            self._emit(f"{BG_LIGHT_BLUE}{GRAY}  No tasks available{RESET}\n")
             return
         
+        lines = []
         for i, task in enumerate(tasks, 1):
-            # Status emoji and color
-            if task.get('status') == 'completed':
-                status_emoji = "✅"
-                status_color = Colors.GREEN
-            elif task.get('status') == 'in_progress':
-                status_emoji = "🚀"
-                status_color = Colors.ORANGE
-            elif task.get('status') == 'failed':
-                status_emoji = "❌"
-                status_color = Colors.RED
-            else:
-                status_emoji = "⏳"
-                status_color = Colors.GRAY
+            # Status emoji
+            status_emoji = self.TASK_STATUS_EMOJI.get(task.get('status'), "⏳")
             
-            # Priority emoji
-            priority = task.get('priority', 'medium')
-            priority_emoji = "🔥" if priority == 'high' else "⚡" if priority == 'medium' else "📌"
+            # Priority emoji; tasks without one count as medium
+            priority_emoji = self.TASK_PRIORITY_EMOJI.get(task.get('priority', 'medium'), "📌")
             
             # Main task line
             task_title = task.get('title', 'Untitled Task')
-            print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}  {i:2d}. {status_emoji} {priority_emoji} " +
-                  f"{Colors.BOLD}{task_title}{Colors.RESET}")
+            lines.append(f"{BG_LIGHT_BLUE}{DARK_BLUE}  {i:2d}. {status_emoji} {priority_emoji} "
+                         f"{BOLD}{task_title}{RESET}\n")
             
             if show_details:
                 # Description
                 if task.get('description'):
-                    print(f"{Colors.BG_LIGHT_BLUE}{Colors.GRAY}      └─ {task['description']}{Colors.RESET}")
+                    lines.append(f"{BG_LIGHT_BLUE}{GRAY}      └─ {task['description']}{RESET}\n")
                 
                 # Progress bar if available
                 if task.get('progress', 0) > 0:
-                    self.print_progress_bar(task['progress'], "     Progress: ", width=30)
+                    lines.append(self._progress_bar_line(task['progress'], "     Progress: ", 30))
+        
+        self._emit(''.join(lines))
     
+    @_buffered
     def print_agent_status(self, status: dict):
         """Print agent status in a beautiful dashboard format"""
-        print(f"{Colors.BG_DARK_BLUE}{Colors.WHITE} 🤖 AGENT STATUS DASHBOARD {Colors.RESET}")
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}{'═' * self.width}{Colors.RESET}")
+        # Always drawn: it is appended below the caller's own output, which
+        # may have scrolled an identical earlier panel off screen
+        self._emit(f"{BG_DARK_BLUE}{WHITE} 🤖 AGENT STATUS DASHBOARD {RESET}\n")
+        self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}{self._double_rule}{RESET}\n")
         
         # Main stats
-        stats = [
-            ("📋 Total Tasks", status.get('total_tasks', 0)),
-            ("⏳ Pending", status.get('pending', 0)),
-            ("🚀 In Progress", status.get('in_progress', 0)),
-            ("✅ Completed", status.get('completed', 0)),
-            ("❌ Failed", status.get('failed', 0)),
-        ]
+        get = status.get
+        stats = [f"{label}: {BOLD}{get(key, 0)}{RESET}{DARK_BLUE}" for label, key in self._AGENT_STATS]
         
         # Print stats in two columns
         for i in range(0, len(stats), 2):
-            left_stat = stats[i]
-            right_stat = stats[i + 1] if i + 1 < len(stats) else ("", "")
-            
-            left_text = f"{left_stat[0]}: {Colors.BOLD}{left_stat[1]}{Colors.RESET}{Colors.DARK_BLUE}"
-            right_text = f"{right_stat[0]}: {Colors.BOLD}{right_stat[1]}{Colors.RESET}{Colors.DARK_BLUE}" if right_stat[0] else ""
+            left_text = stats[i]
+            right_text = stats[i + 1] if i + 1 < len(stats) else ""
             
-            print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}  {left_text:<30} {right_text}{Colors.RESET}")
+            self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}  {left_text:<30} {right_text}{RESET}\n")
         
         # Completion rate
-        completion_rate = status.get('completion_rate', 0)
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}{'─' * self.width}{Colors.RESET}")
+        completion_rate = get('completion_rate', 0)
+        self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}{self._rule}{RESET}\n")
         self.print_progress_bar(completion_rate, "  📈 Completion Rate:", width=50)
         
         # Next task
-        next_task = status.get('next_task', 'None')
-        print(f"{Colors.BG_LIGHT_BLUE}{Colors.DARK_BLUE}  🎯 Next Task: {Colors.BOLD}{next_task}{Colors.RESET}")
-        print()
+        next_task = get('next_task', 'None')
+        self._emit(f"{BG_LIGHT_BLUE}{DARK_BLUE}  🎯 Next Task: {BOLD}{next_task}{RESET}\n")
+        self._emit("\n")
     
+    @_buffered
     def input_prompt(self, prompt: str, prompt_type: str = "normal") -> str:
         """Fixed position input prompt at bottom of container"""
         if prompt_type == "agent":
             emoji = "🤖"
-            color = Colors.SOFT_BLUE
+            color = SOFT_BLUE
         elif prompt_type == "error":
             emoji = "❌"
-            color = Colors.SOFT_RED
+            color = SOFT_RED
         elif prompt_type == "success":
             emoji = "✅"
-            color = Colors.SOFT_GREEN
+            color = SOFT_GREEN
         else:
             emoji = "💬"
-            color = Colors.SOFT_CYAN
+            color = SOFT_CYAN
         
         terminal_height = self.get_terminal_height()
         container_width = self.width - 2
         input_row = terminal_height - 2
         
-        # Print input line at fixed position
+        # Print input line at fixed position; the row, cursor move and cursor
+        # show all go out in the single write before input() blocks
         input_line = f" {emoji} {prompt}: "
-        spaces_needed = container_width - len(input_line) - 1
-        print(f"\033[{input_row};1H{Colors.BORDER_LIGHT}│ {color}{input_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._emit(f"\033[{input_row};1H")
+        self._message_row(color, input_line, container_width - 1)
         
         try:
-            # Position cursor for input
-            print(f"\033[{input_row};{len(input_line) + 2}H", end="")
-            print('\033[?25h', end='')  # Show cursor
+            # Position cursor for input and show it only while reading
+            self._emit(f"\033[{input_row};{len(input_line) + 2}H\033[?25h")
+            self._flush()  # The prompt must be on screen before blocking
             user_input = input()
-            print('\033[?25l', end='')  # Hide cursor again
             
-            # Clear input line and show what was entered
-            display_line = f" > {user_input}"
-            spaces_needed = container_width - len(display_line) - 1
-            print(f"\033[{input_row};1H{Colors.BORDER_LIGHT}│ {Colors.LIGHT_GRAY}{display_line}{Colors.RESET}" + 
-                  " " * spaces_needed + 
-                  f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+            # Hide cursor again, clear input line and show what was entered
+            self._emit(f"\033[?25l\033[{input_row};1H")
+            self._message_row(LIGHT_GRAY, f" > {user_input}", container_width - 1)
             return user_input
         except (KeyboardInterrupt, EOFError):
-            goodbye_line = " Goodbye! 👋"
-            spaces_needed = container_width - len(goodbye_line) - 1
-            print(f"\033[{input_row};1H{Colors.BORDER_LIGHT}│ {Colors.GRAY}{goodbye_line}{Colors.RESET}" + 
-                  " " * spaces_needed + 
-                  f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
-            print('\033[?25h', end='')  # Show cursor before exit
-            sys.exit(0)
+            self._emit(f"\033[{input_row};1H")
+            self._message_row(GRAY, " Goodbye! 👋", container_width - 1)
+            sys.exit(0)  # The atexit hook shows the cursor again
     
+    @_buffered
     def clear_screen(self):
         """Clear screen for containerized display"""
-        print('\033[2J', end='')  # Clear screen
-        print('\033[H', end='')   # Move cursor to top
+        self._emit(self._CLEAR_SCREEN)
     
+    @_buffered
     def print_success(self, message: str):
         """Print medical-themed success message in container"""
         container_width = self.width - 4
         msg_line = f" ✅ RECOVERY: {message}"
-        spaces_needed = container_width - len(msg_line)
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.SOFT_GREEN}{msg_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(SOFT_GREEN, msg_line, container_width)
     
+    @_buffered
     def print_error(self, message: str):
         """Print medical-themed error message in container"""
         container_width = self.width - 4
         msg_line = f" 🩺 DIAGNOSIS: {message}"
-        spaces_needed = container_width - len(msg_line)
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.SOFT_RED}{msg_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(SOFT_RED, msg_line, container_width)
     
+    @_buffered
     def print_warning(self, message: str):
         """Print medical-themed warning message in container"""
         container_width = self.width - 4
         msg_line = f" ⚠️ SYMPTOM: {message}"
-        spaces_needed = container_width - len(msg_line)
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.SOFT_YELLOW}{msg_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(SOFT_YELLOW, msg_line, container_width)
     
+    @_buffered
     def print_info(self, message: str):
         """Print medical-themed info message in container"""
         container_width = self.width - 4
         msg_line = f" 💊 TREATMENT: {message}"
-        spaces_needed = container_width - len(msg_line)
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.SOFT_BLUE}{msg_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(SOFT_BLUE, msg_line, container_width)
     
     
+    @_buffered
     def print_critical(self, message: str):
         """Print critical medical emergency message"""
         container_width = self.width - 4
         msg_line = f" 🚨 EMERGENCY: {message}"
-        # Flash effect for critical messages
-        for _ in range(3):
-            print(f"\033[7m{Colors.BORDER_LIGHT}│ {Colors.BG_ERROR}{Colors.WHITE}" + 
-                  f"{msg_line}".ljust(container_width) + 
-                  f"{Colors.RESET}\033[7m{Colors.BORDER_LIGHT} │{Colors.RESET}")
-            time.sleep(0.2)
-            print(f"\033[A\033[K", end='')  # Move up and clear line
-            time.sleep(0.1)
-        # Final display
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_ERROR}{Colors.WHITE}" + 
-              f"{msg_line}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        # Flash effect for critical messages; the terminal does the blinking,
+        # so the caller is not held up while it plays
+        self._content_row(BLINK + WHITE, msg_line, container_width, BG_ERROR)
     
+    @_buffered
     def print_diagnosis(self, title: str, symptoms: list, treatment: str = None):
         """Print a complete medical diagnosis with symptoms and treatment"""
         container_width = self.width - 4
         
         # Diagnosis header
         header_line = f" 🏥 MEDICAL DIAGNOSIS: {title}"
-        print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_HEADER}{Colors.WHITE}" + 
-              f"{header_line}".ljust(container_width) + 
-              f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+        self._content_row(WHITE, header_line, container_width, BG_HEADER)
         
         # Symptoms
         if symptoms:
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.SOFT_RED}" + 
-                  f" 🔍 SYMPTOMS DETECTED:".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            self._content_row(SOFT_RED, f" 🔍 SYMPTOMS DETECTED:", container_width)
             
             for symptom in symptoms[:5]:  # Limit to 5 symptoms
                 symptom_line = f"   • {symptom}"
                 if len(symptom_line) > container_width - 2:
                     symptom_line = symptom_line[:container_width-5] + "..."
-                print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.LIGHT_GRAY}" + 
-                      f"{symptom_line}".ljust(container_width) + 
-                      f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+                self._content_row(LIGHT_GRAY, symptom_line, container_width)
         
         # Treatment recommendation
         if treatment:
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.SOFT_GREEN}" + 
-                  f" 💊 PRESCRIBED TREATMENT:".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            self._content_row(SOFT_GREEN, f" 💊 PRESCRIBED TREATMENT:", container_width)
             
             treatment_line = f"   {treatment}"
             if len(treatment_line) > container_width - 2:
                 treatment_line = treatment_line[:container_width-5] + "..."
-            print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{Colors.LIGHT_GRAY}" + 
-                  f"{treatment_line}".ljust(container_width) + 
-                  f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            self._content_row(LIGHT_GRAY, treatment_line, container_width)
     
+    @_buffered
     def print_splash_screen(self):
         """Display the main splash screen"""
         self.clear_screen()
         
         # ASCII Art Header
-        print(f"{Colors.SOFT_CYAN}")
-        print("    ____                      _       _   _             ")
-        print("   |  _ \ _   _ ___  ___ _ __(_)_ __ | |_(_) ___  _ __  ")
-        print("   | |_) | | | / __|/ __| '__| | '_ \| __| |/ _ \| '_ \ ")
-        print("   |  __/| |_| \__ \ (__| |  | | |_) | |_| | (_) | | | |")
-        print("   |_|    \__, |___/\___|_|  |_| .__/ \__|_|\___/|_| |_|")
-        print("          |___/                |_|                      ")
-        print(f"{Colors.RESET}")
-        print()
+        self._emit(f"{SOFT_CYAN}\n")
+        self._emit("    ____                      _       _   _             \n")
+        self._emit("   |  _ \ _   _ ___  ___ _ __(_)_ __ | |_(_) ___  _ __  \n")
+        self._emit("   | |_) | | | / __|/ __| '__| | '_ \| __| |/ _ \| '_ \ \n")
+        self._emit("   |  __/| |_| \__ \ (__| |  | | |_) | |_| | (_) | | | |\n")
+        self._emit("   |_|    \__, |___/\___|_|  |_| .__/ \__|_|\___/|_| |_|\n")
+        self._emit("          |___/                |_|                      \n")
+        self._emit(f"{RESET}\n")
+        self._emit("\n")
         
         # Version and tagline
-        print(f"{Colors.SOFT_YELLOW}           💊 Terminal medication. No prescription needed.{Colors.RESET}")
-        print()
-        print(f"{Colors.SOFT_GREEN}    🏥 AI-Enhanced Python Development Assistant{Colors.RESET}")
-        print(f"{Colors.LIGHT_GRAY}    🔬 Diagnose • 💉 Inject • 💊 Medicate • 🧬 Evolve{Colors.RESET}")
-        print()
+        self._emit(f"{SOFT_YELLOW}           💊 Terminal medication. No prescription needed.{RESET}\n")
+        self._emit("\n")
+        self._emit(f"{SOFT_GREEN}    🏥 AI-Enhanced Python Development Assistant{RESET}\n")
+        self._emit(f"{LIGHT_GRAY}    🔬 Diagnose • 💉 Inject • 💊 Medicate • 🧬 Evolve{RESET}\n")
+        self._emit("\n")
     
+    @_buffered
     def print_sticky_container_header(self, title: str, current_dir: str):
         """Print a sticky header with title and current directory"""
         import os
         
         # Clear screen and position cursor at top
-        print('\033[2J\033[H', end='')
+        self._emit(self._CLEAR_SCREEN)
         
         container_width = self.width - 4
         
         # Top border
-        print(f"{Colors.BORDER_LIGHT}┌{'─' * (self.width - 2)}┐{Colors.RESET}")
+        self._emit(self._top_border)
         
         # Title line
         title_line = f" 💊 {title}"
-        spaces_needed = container_width - len(title_line)
-        print(f"{Colors.BORDER_LIGHT}│{Colors.SOFT_CYAN}{title_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(SOFT_CYAN, title_line, container_width, lead='')
         
         # Directory line
         dir_display = os.path.basename(current_dir) or current_dir
         if len(dir_display) > container_width - 10:
             dir_display = "..." + dir_display[-(container_width-13):]
         dir_line = f" 📁 {dir_display}"
-        spaces_needed = container_width - len(dir_line)
-        print(f"{Colors.BORDER_LIGHT}│{Colors.GRAY}{dir_line}{Colors.RESET}" + 
-              " " * spaces_needed + 
-              f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+        self._message_row(GRAY, dir_line, container_width, lead='')
         
         # Separator line
-        print(f"{Colors.BORDER_LIGHT}├{'─' * (self.width - 2)}┤{Colors.RESET}")
+        self._emit(self._divider)
         
         # Store current position for scrollable content
         self.content_start_row = 5  # Header takes 4 rows + separator
     
+    @_buffered
     def print_scrollable_content_line(self, content: str, color: str = None):
         """Print a single line of scrollable content inside the container"""
         container_width = self.width - 4
-        text_color = color or Colors.LIGHT_GRAY
+        text_color = color or LIGHT_GRAY
         
         # Wrap long content
-        if len(content) > container_width:
+        if visible_len(content) > container_width:
             wrapped_lines = self.wrap_text(content, container_width)
             for line in wrapped_lines:
-                # Calculate actual visual length (excluding ANSI codes)
-                visual_length = len(line)
-                spaces_needed = container_width - visual_length
-                print(f"{Colors.BORDER_LIGHT}│ {text_color}{line}{Colors.RESET}" + 
-                      " " * spaces_needed + 
-                      f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+                self._message_row(text_color, line, container_width)
         else:
-            # Calculate actual visual length (excluding ANSI codes)
-            visual_length = len(content)
-            spaces_needed = container_width - visual_length
-            print(f"{Colors.BORDER_LIGHT}│ {text_color}{content}{Colors.RESET}" + 
-                  " " * spaces_needed + 
-                  f"{Colors.BORDER_LIGHT}│{Colors.RESET}")
+            self._message_row(text_color, content, container_width)
     
+    @_buffered
     def print_sticky_container_footer(self):
         """Print the bottom border of the sticky container"""
-        print(f"{Colors.BORDER_LIGHT}└{'─' * (self.width - 2)}┘{Colors.RESET}")
+        self._emit(self._bottom_border)
     
     def get_terminal_height(self) -> int:
         """Get terminal height for scrollable content calculation"""
-        try:
-            return os.get_terminal_size().lines
-        except:
-            return 24  # Safe default
+        if self._size is None:
+            self.update_terminal_size()
+        return self._size.lines
     
     def get_scrollable_content_height(self) -> int:
         """Calculate available height for scrollable content"""
@@ -669,56 +801,63 @@ class TerminalUI:
         
         return max(5, total_height - header_height - footer_height - input_height)
     
+    @_buffered
     def restore_terminal(self):
         """Restore terminal to default state"""
-        print('\033[?25h', end='')  # Show cursor
-        print(Colors.RESET, end='')
+        self._emit('\033[?25h' + RESET)  # Show cursor and reset colors
         if os.name != 'nt':
-            print('\033[2J\033[H', end='')  # Clear and reset
+            self._emit(self._CLEAR_SCREEN)
 
 
+    @_buffered
     def print_container_frame(self):
         """Print the container frame top"""
-        print(f"{Colors.BORDER_LIGHT}┌{'─' * (self.width - 2)}┐{Colors.RESET}")
+        self._emit(self._top_border)
     
+    @_buffered
     def print_container_bottom(self):
         """Print the container frame bottom"""
-        print(f"{Colors.BORDER_LIGHT}└{'─' * (self.width - 2)}┘{Colors.RESET}")
+        self._emit(self._bottom_border)
     
+    @_buffered
     def print_container_separator(self):
         """Print a separator line within container"""
-        print(f"{Colors.BORDER_LIGHT}│{' ' * (self.width - 2)}│{Colors.RESET}")
+        self._emit(self._blank_row)
     
     def update_terminal_size(self):
         """Update terminal width for responsive design"""
+        if self._size is None or not self._watching_resize:
+            # Without SIGWINCH (e.g. Windows) the size has to be polled
+            self._size = self._read_terminal_size()
         self.width = self._get_terminal_width()
     
     def wrap_text(self, text: str, max_width: int) -> list:
         """Intelligently wrap text for better readability"""
-        words = text.split()
+        # With single spaces between words, the greedy line break is simply
+        # the last space within max_width of the line start, so each line
+        # costs one rfind instead of a length check per word
+        text = " ".join(text.split())
         lines = []
-        current_line = ""
+        start, end = 0, len(text)
         
-        for word in words:
-            # Check if adding this word would exceed the width
-            test_line = current_line + (" " if current_line else "") + word
-            if len(test_line) <= max_width:
-                current_line = test_line
+        while end - start > max_width:
+            cut = text.rfind(" ", start, start + max_width + 1)
+            if cut != -1:
+                lines.append(text[start:cut])
             else:
-                if current_line:
-                    lines.append(current_line)
                 # If single word is too long, truncate it
-                if len(word) > max_width:
-                    lines.append(word[:max_width-3] + "...")
-                    current_line = ""
-                else:
-                    current_line = word
+                cut = text.find(" ", start)
+                if cut == -1:
+                    cut = end
+                lines.append(text[start:cut][:max_width-3] + "...")
+            start = cut + 1
         
-        if current_line:
-            lines.append(current_line)
+        if start < end:
+            lines.append(text[start:])
         
         return lines if lines else [""]
     
+    @_buffered
     def print_container_content(self, content: str, color: str = None):
         """Print content within the container borders with intelligent wrapping"""
         # Update terminal size for responsive design
@@ -726,22 +865,27 @@ class TerminalUI:
         container_width = self.width - 4
         lines = content.split('\n')
         
-        text_color = color or Colors.LIGHT_GRAY
+        text_color = color or LIGHT_GRAY
         
         for line in lines:
             # Use intelligent wrapping for long lines
-            if len(line) > container_width:
-                wrapped_lines = self.wrap_text(line, container_width)
-                for wrapped_line in wrapped_lines:
-                    print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{text_color}" + 
-                          f"{wrapped_line}".ljust(container_width) + 
-                          f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+            if visible_len(line) > container_width:
+                for wrapped_line in self.wrap_text(line, container_width):
+                    self._content_row(text_color, wrapped_line, container_width)
             else:
                 # Print lines that fit normally
-                print(f"{Colors.BORDER_LIGHT}│ {Colors.BG_CONTENT}{text_color}" + 
-                      f"{line}".ljust(container_width) + 
-                      f"{Colors.RESET}{Colors.BORDER_LIGHT} │{Colors.RESET}")
+                self._content_row(text_color, line, container_width)
+
+
+# Global UI instance, created on first access so that importing this module
+# (e.g. just for Colors) does not clear the screen
+ui: TerminalUI
 
 
-# Global UI instance
-ui = TerminalUI()
\ No newline at end of file
+def __getattr__(name: str) -> TerminalUI:
+    """Build the global UI instance the first time it is looked up"""
+    if name == 'ui':
+        global ui
+        ui = TerminalUI()
+        return ui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@
 Setup script for Pyscription - ML-Enhanced Python Development Assistant
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -14,6 +15,19 @@ long_description = (this_directory / "README.md").read_text(encoding='utf-8')
 requirements = (this_directory / "requirements.txt").read_text().strip().split('\n')
 requirements = [req.strip() for req in requirements if req.strip() and not req.startswith('#')]
 
+# Optional ahead-of-time compilation of the AST analysis and terminal rendering
+# hot paths with mypyc.
+# Opt in with PYSCRIPTION_USE_MYPYC=1; the pure-Python modules are used otherwise.
+ext_modules = []
+if os.environ.get("PYSCRIPTION_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        # Only the compiled modules must type-check; their imports are read for types
+        "--follow-imports=silent",
+        "pyscription/core/project_analyzer.py",
+        "pyscription/utils/_render.py",
+    ])
+
 setup(
     name="pyscription",
     version="1.0.0",
@@ -30,6 +44,7 @@ setup(
         "Discussions": "https://github.com/your-username/pyscription/discussions",
     },
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -67,6 +82,9 @@ setup(
             "bandit>=1.7.0",
             "safety>=2.0.0",
         ],
+        "gitignore": [
+            "pathspec>=0.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
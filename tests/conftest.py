@@ -85,13 +85,13 @@ def security_analyzer() -> SecurityPatternAnalyzer:
     return SecurityPatternAnalyzer()
 
 
-@pytest.fixture
-def sample_files(temp_dir) -> dict:
-    """Create sample Python files for testing."""
-    files = {}
+@pytest.fixture(scope="session")
+def _sample_files_dir(tmp_path_factory) -> Path:
+    """Write the sample Python files once per test session."""
+    samples_dir = tmp_path_factory.mktemp("samples")
     
     # Simple Python file
-    simple_file = temp_dir / "simple.py"
+    simple_file = samples_dir / "simple.py"
     simple_file.write_text('''
 def hello_world():
     print("Hello, World!")
@@ -99,10 +99,9 @@ def hello_world():
 if __name__ == "__main__":
     hello_world()
 ''')
-    files['simple'] = simple_file
     
     # Complex Python file
-    complex_file = temp_dir / "complex.py"
+    complex_file = samples_dir / "complex.py"
     complex_file.write_text('''
 class DataProcessor:
     def __init__(self, data):
@@ -136,10 +135,9 @@ class DataProcessor:
         result['metadata'] = item.get('metadata', {})
         return result
 ''')
-    files['complex'] = complex_file
     
     # Vulnerable Python file
-    vulnerable_file = temp_dir / "vulnerable.py"
+    vulnerable_file = samples_dir / "vulnerable.py"
     vulnerable_file.write_text('''
 import os
 import pickle
@@ -157,6 +155,15 @@ def execute_command(cmd):
 def deserialize_data(data):
     return pickle.loads(data)
 ''')
-    files['vulnerable'] = vulnerable_file
     
+    return samples_dir
+
+
+@pytest.fixture
+def sample_files(_sample_files_dir, temp_dir) -> dict:
+    """Create sample Python files for testing."""
+    # Each test gets its own copies, so tests may modify them freely
+    files = {}
+    for name in ('simple', 'complex', 'vulnerable'):
+        files[name] = Path(shutil.copy(_sample_files_dir / f"{name}.py", temp_dir))
     return files
\ No newline at end of file
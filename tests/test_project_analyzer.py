@@ -0,0 +1,42 @@
+"""
+Tests for the project-wide code analysis engine
+"""
+
+from pyscription.core.project_analyzer import ProjectAnalyzer
+
+
+def test_class_methods_include_async_methods(temp_dir):
+    """Async methods count towards a class's methods."""
+    source = temp_dir / "service.py"
+    source.write_text('''
+class Service:
+    def start(self):
+        pass
+    
+    async def fetch(self):
+        pass
+''')
+    
+    analysis = ProjectAnalyzer(str(temp_dir))._analyze_file(source)
+    
+    service = analysis['classes'][0]
+    assert service['methods'] == 2
+    assert service['method_names'] == ['start', 'fetch']
+
+
+def test_relative_imports_are_internal(temp_dir):
+    """Relative imports are internal and keep their leading dots."""
+    package = temp_dir / "app"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "events.py").write_text('''
+import json
+from . import handlers
+from .models import User
+from ..shared import config
+''')
+    
+    dependencies = ProjectAnalyzer(str(temp_dir)).analyze_project()['dependencies']
+    
+    assert dependencies['internal_dependencies'] == ['.', '..shared', '.models']
+    assert dependencies['external_dependencies'] == ['json']
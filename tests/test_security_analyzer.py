@@ -0,0 +1,74 @@
+"""
+Tests for the security vulnerability pattern analyzer
+"""
+
+import pytest
+
+from pyscription.core.security_analyzer import SecurityPatternAnalyzer, VulnerabilityLevel
+
+
+class TodoMarkerAnalyzer(SecurityPatternAnalyzer):
+    """Analyzer with an extra low-severity pattern, since no built-in check reports LOW."""
+    
+    def _init_vulnerability_patterns(self):
+        patterns = super()._init_vulnerability_patterns()
+        patterns['todo_marker'] = {
+            'patterns': [r'#\s*todo'],
+            'severity': VulnerabilityLevel.LOW,
+            'description': 'Unresolved TODO',
+            'recommendation': 'Resolve the TODO'
+        }
+        return patterns
+
+
+@pytest.mark.security
+def test_issues_sorted_by_severity_rank():
+    """Issues run from most to least severe, not alphabetically by severity name."""
+    code = '''import random
+# TODO: seed properly
+value = random.random()
+result = eval(value)
+'''
+    
+    issues = TodoMarkerAnalyzer().analyze_code_security(code)
+    
+    assert [issue.severity for issue in issues] == [
+        VulnerabilityLevel.CRITICAL, VulnerabilityLevel.MEDIUM, VulnerabilityLevel.LOW
+    ]
+
+
+@pytest.mark.security
+def test_undecorated_function_is_checked(security_analyzer):
+    """Both AST (eval) and regex (weak random) findings are reported for plain functions."""
+    code = '''import random
+
+def handler(value):
+    token = random.random()
+    return eval(value)
+'''
+    
+    issues = security_analyzer.analyze_code_security(code)
+    
+    assert {issue.issue_type for issue in issues} == {'dangerous_function', 'weak_random'}
+
+
+@pytest.mark.security
+@pytest.mark.parametrize("decorator", ["@trusted", "@checks.no_security_check()"])
+@pytest.mark.parametrize("keyword", ["def", "async def"])
+def test_skip_decorators_silence_function(security_analyzer, decorator, keyword):
+    """Functions marked with a skip decorator report neither AST nor regex findings."""
+    code = f'''import random
+
+{decorator}
+{keyword} handler(value):
+    token = random.random()
+    return eval(value)
+
+result = eval(input())
+'''
+    
+    issues = security_analyzer.analyze_code_security(code)
+    
+    assert [(issue.issue_type, issue.line_number) for issue in issues] == [
+        ('dangerous_function', 8)
+    ]
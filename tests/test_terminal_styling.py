@@ -0,0 +1,65 @@
+"""
+Tests for the terminal UI rendering
+"""
+
+import pytest
+
+from pyscription.utils.terminal_styling import Colors, TerminalUI, visible_len
+
+
+@pytest.fixture
+def terminal_ui(monkeypatch) -> TerminalUI:
+    """Terminal UI on an 80 column terminal, writing to the captured stdout."""
+    monkeypatch.setenv("COLUMNS", "80")
+    monkeypatch.setenv("LINES", "24")
+    return TerminalUI()
+
+
+def test_visible_len_ignores_escape_sequences():
+    """Escape sequences take no space on screen."""
+    assert visible_len("\033[38;5;75mdef\033[0m f():") == len("def f():")
+    assert visible_len("plain") == 5
+
+
+def test_container_rows_fill_width(terminal_ui, capsys):
+    """Highlighted and truncated rows are padded to exactly the container width."""
+    terminal_ui.print_code_block_container('def f(x):\n    return "' + 'x' * 200 + '"  # done')
+    terminal_ui.print_command_help([("/help", "Show help"), ("/analyze", "d" * 200)])
+    
+    rows = capsys.readouterr().out.splitlines()
+    
+    assert rows
+    assert all(len(row) == terminal_ui.width for row in rows if row)
+
+
+@pytest.mark.parametrize("name", [
+    "BG_GREEN", "BG_RED", "BG_YELLOW", "BG_LIGHT_BLUE", "BG_DARK_BLUE", "BG_GRAY", "BG_WHITE",
+    "GREEN", "RED", "ORANGE", "BLUE", "DARK_BLUE", "LIGHT_BLUE", "BRIGHT_BLUE", "CYAN", "PURPLE",
+])
+def test_color_aliases_are_defined(name):
+    """Every color the UI components use is an escape sequence on Colors."""
+    assert getattr(Colors, name).startswith("\033[")
+
+
+def test_components_using_color_aliases_render(terminal_ui, capsys):
+    """Components that used to reference undefined colors render without errors."""
+    tasks = [
+        {'title': "Write tests", 'status': 'completed', 'priority': 'high', 'description': "Cover the UI"},
+        {'title': "Ship release", 'status': 'pending'},
+    ]
+    
+    terminal_ui.print_status_box("Checks", ["All passed"], "success")
+    terminal_ui.print_progress_bar(0.5, "Halfway")
+    terminal_ui.print_live_progress(0.25, "Indexing", "docs")
+    terminal_ui.animate_thinking()
+    terminal_ui.stop_progress()
+    terminal_ui.print_task_progress_dashboard({'completed': 1, 'pending': 1}, "Ship release")
+    terminal_ui.print_code_block("print('hi')")
+    terminal_ui.print_task_list(tasks, show_details=True)
+    terminal_ui.print_agent_status({'total_tasks': 2, 'completed': 1, 'completion_rate': 0.5})
+    
+    output = capsys.readouterr().out
+    
+    assert "Agent thinking" in output
+    assert "Write tests" in output
+    assert "AGENT STATUS DASHBOARD" in output